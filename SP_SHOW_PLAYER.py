@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import datetime
+import functools
 import math
 import os
 import platform
@@ -18,6 +19,9 @@ import time
 import uuid
 import webbrowser
 import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from urllib import request as urlrequest
 from urllib.error import URLError
 from dataclasses import dataclass
@@ -28,6 +32,32 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
 
+try:
+    from PIL import Image, ImageChops, ImageTk
+
+    _HAS_PIL = True
+except Exception:
+    Image = None  # type: ignore[assignment]
+    ImageChops = None  # type: ignore[assignment]
+    ImageTk = None  # type: ignore[assignment]
+    _HAS_PIL = False
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore[assignment]
+    _HAS_ORJSON = False
+
+try:
+    import mutagen
+
+    _HAS_MUTAGEN = True
+except Exception:
+    mutagen = None  # type: ignore[assignment]
+    _HAS_MUTAGEN = False
+
 CueKind = Literal["audio", "video", "ppt"]
 
 APP_NAME = "S.P. Show Control"
@@ -442,29 +472,59 @@ def _parse_timecode(value: str) -> float | None:
     raise ValueError(f"Invalid timecode: {value!r}")
 
 
+_TC_TWO_DIGIT = [f"{i:02d}" for i in range(100)]
+_TC_THREE_DIGIT = [f"{i:03d}" for i in range(1000)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timecode_whole(total: int) -> str:
+    s = total % 60
+    m = (total // 60) % 60
+    h = total // 3600
+    if h:
+        return str(h) + ":" + _TC_TWO_DIGIT[m] + ":" + _TC_TWO_DIGIT[s]
+    return str(m) + ":" + _TC_TWO_DIGIT[s]
+
+
 def _format_timecode(seconds: float | None, with_ms: bool = False) -> str:
     if seconds is None:
         return ""
     if with_ms:
         # Format with milliseconds: mm:ss.mmm
-        total_sec = max(0, float(seconds))
-        ms = int(round((total_sec % 1) * 1000))
-        total = int(total_sec)
-        s = total % 60
-        m = (total // 60) % 60
-        h = total // 3600
-        if h:
-            return f"{h}:{m:02d}:{s:02d}.{ms:03d}"
-        return f"{m}:{s:02d}.{ms:03d}"
-    else:
-        # Standard format without milliseconds
-        total = max(0, int(round(seconds)))
-        s = total % 60
-        m = (total // 60) % 60
-        h = total // 3600
-        if h:
-            return f"{h}:{m:02d}:{s:02d}"
-        return f"{m}:{s:02d}"
+        total_ms = int(round(max(0.0, float(seconds)) * 1000))
+        return _format_timecode_whole(total_ms // 1000) + "." + _TC_THREE_DIGIT[total_ms % 1000]
+    # Standard format without milliseconds; the whole-second part is memoized since the
+    # playhead/now-playing labels ask for the same second ~30 times.
+    return _format_timecode_whole(max(0, int(round(seconds))))
+
+
+_TC_COLUMN_CACHE: dict[float, str] = {}
+
+
+def _format_timecode_column(values: list[float | None], empty: str = "") -> list[str]:
+    # Tree rebuilds format the same IN/OUT values over and over (both decks, every refresh).
+    out: list[str] = []
+    cache = _TC_COLUMN_CACHE
+    if len(cache) > 4096:
+        cache.clear()
+    for v in values:
+        if not v:
+            out.append(empty)
+            continue
+        tc = cache.get(v)
+        if tc is None:
+            tc = _format_timecode(v)
+            cache[v] = tc
+        out.append(tc)
+    return out
+
+
+def _tk_safe(fn: Callable, *args, **kwargs):
+    # Widget ops only fail with TclError (destroyed widget, bad item); anything else is a real bug.
+    try:
+        return fn(*args, **kwargs)
+    except tk.TclError:
+        return None
 
 
 def _shorten_middle(text: str, max_len: int = 48) -> str:
@@ -490,6 +550,96 @@ def _clamp_float(value: object, low: float, high: float, default: float) -> floa
     return max(float(low), min(float(high), float(v)))
 
 
+def _vu_step(
+    target: float,
+    cur: float,
+    peak: float,
+    hold_until: float,
+    now: float,
+    dt: float,
+    seg_total: int,
+    min_db: float,
+    max_db: float,
+) -> tuple[float, float, float, int, int]:
+    """One VU meter frame: attack/decay smoothing, peak hold and LED segment counts.
+
+    Returns (level, peak, peak_hold_until, lit_segments, red_zone_start).
+    """
+    if target >= cur:
+        cur = cur + (target - cur) * min(1.0, 18.0 * dt)
+    else:
+        cur = max(target, cur - (2.2 * dt))
+    cur = max(0.0, min(1.0, cur))
+
+    if cur >= peak:
+        peak = cur
+        hold_until = now + 0.8
+    elif now > hold_until:
+        peak = max(cur, peak - (1.6 * dt))
+    peak = max(0.0, min(1.0, peak))
+
+    lit = int(round(cur * seg_total))
+    # Red zone: last ~6 dB (relative to the top of scale).
+    red_zone_norm = ((max_db - 6.0) - min_db) / (max_db - min_db)
+    red_zone_start = max(0, min(seg_total - 1, int(seg_total * max(0.0, min(1.0, red_zone_norm)))))
+    return cur, peak, hold_until, lit, red_zone_start
+
+
+_HEX_BYTE = tuple(f"{i:02x}" for i in range(256))
+
+
+def _mix_rgb(c1: tuple[int, int, int], c2: tuple[int, int, int], t: float) -> str:
+    t = max(0.0, min(1.0, float(t)))
+    r = int(c1[0] + (c2[0] - c1[0]) * t)
+    g = int(c1[1] + (c2[1] - c1[1]) * t)
+    b = int(c1[2] + (c2[2] - c1[2]) * t)
+    return "#" + _HEX_BYTE[r] + _HEX_BYTE[g] + _HEX_BYTE[b]
+
+
+@functools.lru_cache(maxsize=64)
+def _vu_layout(w: int, h: int, seg_count: int) -> tuple[tuple[int, int, int, int], tuple[tuple[int, int, int, int], ...]]:
+    """VU bar geometry for a canvas size: (background box, LED segment boxes)."""
+    # Thin LED-style bar area.
+    bar_h = max(6, min(10, h))
+    y0 = int((h - bar_h) / 2)
+    y1 = y0 + bar_h
+    inner_y0 = y0 + 1
+    inner_y1 = y1 - 1
+
+    seg_total = max(1, int(seg_count))
+    gap = 1
+    usable_w = max(1, (w - 2) - (seg_total - 1) * gap)
+    seg_w = max(1, int(usable_w / seg_total))
+    # If too cramped, reduce the number of visible segments.
+    while seg_total > 12 and seg_w <= 2:
+        seg_total -= 4
+        usable_w = max(1, (w - 2) - (seg_total - 1) * gap)
+        seg_w = max(1, int(usable_w / seg_total))
+
+    boxes = []
+    for i in range(seg_total):
+        x0 = 1 + i * (seg_w + gap)
+        boxes.append((x0, inner_y0, min(w - 1, x0 + seg_w), inner_y1))
+    return (0, y0, w, y1), tuple(boxes)
+
+
+def _playback_geometry(seg_start: float, seg_end: float, pos: float, duration: float, width: int) -> tuple[int, int, int]:
+    # Seconds -> canvas x for the IN/OUT segment and playhead, with one division per frame.
+    scale = float(width) / float(duration)
+    x0 = max(0, min(width, int(seg_start * scale)))
+    x1 = max(0, min(width, int(seg_end * scale)))
+    if x1 < x0:
+        x0, x1 = x1, x0
+    px = max(0, min(width, int(pos * scale)))
+    return x0, x1, px
+
+
+def _blink_phases() -> tuple[bool, bool]:
+    # (slow 3 Hz, fast 4 Hz) on-phases shared by every deck within one frame.
+    now = time.monotonic()
+    return (int(now * 3) & 1) == 0, (int(now * 4) & 1) == 0
+
+
 def _shell_quote(s: str) -> str:
     if s == "":
         return "''"
@@ -499,6 +649,65 @@ def _shell_quote(s: str) -> str:
     return "'" + s.replace("'", "'\"'\"'") + "'"
 
 
+def _read_json_file(path: Path):
+    # Parse straight from bytes: no intermediate str decode; orjson when available.
+    raw = path.read_bytes()
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except Exception:
+            pass
+    return json.loads(raw)
+
+
+def _encode_show(payload) -> bytes:
+    # Indented UTF-8 JSON; orjson when available (same layout), stdlib json otherwise.
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except Exception:
+            pass
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _encode_cue_list(cues) -> bytes:
+    # Splices each cue's cached encoding in at list depth; same bytes as encoding the whole list.
+    if not cues:
+        return b"[]"
+    sep = b"\n    "
+    return b"[" + sep + (b"," + sep).join(c.json_bytes().replace(b"\n", sep) for c in cues) + b"\n  ]"
+
+
+def _encode_show_doc(settings: dict, cues_a, cues_b) -> bytes:
+    head = _encode_show({"version": 2, "settings": settings})
+    return (
+        head[:-2]
+        + b',\n  "cues_a": '
+        + _encode_cue_list(cues_a)
+        + b',\n  "cues_b": '
+        + _encode_cue_list(cues_b)
+        + b"\n}"
+    )
+
+
+def _write_json_file(path: Path, data: bytes) -> None:
+    # Takes already-encoded JSON (see _show_bytes). Written next to the target, synced, then
+    # swapped in, so a crash mid-save never leaves a truncated or empty show file behind.
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+        raise
+
+
 def _extract_last_json_object(text: str) -> dict | None:
     try:
         s = str(text or "")
@@ -569,9 +778,26 @@ class Cue:
     loudness_i_lufs: float | None = None
     true_peak_db: float | None = None
 
+    def __setattr__(self, name: str, value) -> None:
+        # Any field write drops the cached encoding, so a save only re-encodes edited cues.
+        object.__setattr__(self, name, value)
+        self.__dict__.pop("_json_bytes", None)
+
+    def json_bytes(self) -> bytes:
+        b = self.__dict__.get("_json_bytes")
+        if b is None:
+            b = _encode_show(self.to_dict())
+            self.__dict__["_json_bytes"] = b
+        return b
+
     def display_name(self) -> str:
         return Path(self.path).name
 
+    @functools.cached_property
+    def display_short(self) -> str:
+        # Tree "name" column; a cue's path never changes after it is created.
+        return _shorten_middle(Path(self.path).name, 64)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -592,41 +818,69 @@ class Cue:
 
     @staticmethod
     def from_dict(data: dict) -> "Cue":
-        stop = data.get("stop_at_sec", None)
-        if stop in ("", "null"):
-            stop = None
-        stop_val = None if stop is None else float(stop)
-        fade_at = data.get("fade_at_sec", None)
-        if fade_at in ("", "null"):
-            fade_at = None
-        fade_val = None if fade_at is None else float(fade_at)
-        vu_profile_q = data.get("vu_profile_q", None)
+        get = data.get
+        stop = get("stop_at_sec")
+        fade_at = get("fade_at_sec")
+        vu_profile_q = get("vu_profile_q")
         if not isinstance(vu_profile_q, list):
             vu_profile_q = None
-        loud_i = data.get("loudness_i_lufs", None)
-        if loud_i in ("", "null"):
-            loud_i = None
-        tp = data.get("true_peak_db", None)
-        if tp in ("", "null"):
-            tp = None
+        vol = get("volume_percent")
+        loud_i = get("loudness_i_lufs")
+        tp = get("true_peak_db")
         return Cue(
-            id=str(data.get("id") or uuid.uuid4()),
-            kind=data.get("kind", "audio"),
-            path=str(data.get("path", "")),
-            note=str(data.get("note", "")),
-            start_sec=float(data.get("start_sec", 0.0)),
-            stop_at_sec=stop_val,
-            fade_at_sec=fade_val,
-            fade_dur_sec=float(data.get("fade_dur_sec", 5.0)),
-            fade_to_percent=int(data.get("fade_to_percent", 100)),
-            open_on_second_screen=bool(data.get("open_on_second_screen", True)),
-            volume_percent=(None if data.get("volume_percent", None) in (None, "", "null") else int(data.get("volume_percent"))),
+            id=str(get("id") or uuid.uuid4()),
+            kind=get("kind", "audio"),
+            path=str(get("path", "")),
+            note=str(get("note", "")),
+            start_sec=float(get("start_sec", 0.0)),
+            stop_at_sec=(None if stop in (None, "", "null") else float(stop)),
+            fade_at_sec=(None if fade_at in (None, "", "null") else float(fade_at)),
+            fade_dur_sec=float(get("fade_dur_sec", 5.0)),
+            fade_to_percent=int(get("fade_to_percent", 100)),
+            open_on_second_screen=bool(get("open_on_second_screen", True)),
+            volume_percent=(None if vol in (None, "", "null") else int(vol)),
             vu_profile_q=vu_profile_q,
-            loudness_i_lufs=(None if loud_i is None else float(loud_i)),
-            true_peak_db=(None if tp is None else float(tp)),
+            loudness_i_lufs=(None if loud_i in (None, "", "null") else float(loud_i)),
+            true_peak_db=(None if tp in (None, "", "null") else float(tp)),
         )
 
 
+def _load_cue_list(rows) -> list[Cue]:
+    # Tree rows use cue.id as iid, which must be unique within a deck; hand-edited show files
+    # can repeat ids, so later duplicates get a fresh one here rather than on every refresh.
+    cues = list(map(Cue.from_dict, rows))
+    seen: set[str] = set()
+    for cue in cues:
+        if cue.id in seen:
+            cue.id = str(uuid.uuid4())
+        seen.add(cue.id)
+    return cues
+
+
+@dataclass
+class DeckCtx:
+    # Per-deck widgets/runner. Lists and dicts that get rebound (cues, id -> index map,
+    # selection, paused state) are referenced by attribute name.
+    canvas: tk.Canvas
+    tree: ttk.Treeview
+    var_in: tk.StringVar
+    var_out: tk.StringVar
+    runner: "MediaRunner"
+    cues_attr: str
+    selected_attr: str
+    cue_index_attr: str
+    paused_attr: str
+
+
+@dataclass
+class VuState:
+    # Smoothed meter level/peak (0..1) for one deck, carried between frames.
+    level: float = 0.0
+    peak: float = 0.0
+    last_t: float = 0.0
+    peak_hold_until: float = 0.0
+
+
 class MediaRunner:
     def __init__(self, settings: Settings):
         self.settings = settings
@@ -636,7 +890,10 @@ class MediaRunner:
         self._playing_seek_sec: float | None = None
         self.last_args: list[str] | None = None
         self.last_exit_code: int | None = None
-        self.last_stderr_tail: list[str] = []
+        # Appended by the stderr reader thread, read by the UI; a bounded deque needs no lock or trim.
+        self.last_stderr_tail: deque[str] = deque(maxlen=80)
+        # Bumped per spawn; stderr readers of replaced processes stop touching shared state.
+        self._gen = 0
 
     def is_playing(self) -> bool:
         if self._proc is None:
@@ -650,7 +907,7 @@ class MediaRunner:
     def current_cue(self) -> Cue | None:
         return self._playing_cue
 
-    def stop(self) -> None:
+    def stop(self, *, wait: bool = True) -> None:
         proc = self._proc
         self._proc = None
         self._playing_cue = None
@@ -658,6 +915,18 @@ class MediaRunner:
         self._playing_seek_sec = None
         if not proc:
             return
+        if not wait:
+            # Respawns don't block on the old decoder's exit; it is reaped in the background.
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+            threading.Thread(target=self._reap, args=(proc,), daemon=True).start()
+            return
+        self._reap(proc)
+
+    @staticmethod
+    def _reap(proc: subprocess.Popen) -> None:
         try:
             proc.terminate()
             proc.wait(timeout=1.5)
@@ -670,7 +939,9 @@ class MediaRunner:
     def _spawn_ffplay(self, args: list[str]) -> subprocess.Popen:
         self.last_args = args
         self.last_exit_code = None
-        self.last_stderr_tail = []
+        self.last_stderr_tail = deque(maxlen=80)
+        self._gen += 1
+        gen = self._gen
 
         proc = subprocess.Popen(
             args,
@@ -686,11 +957,9 @@ class MediaRunner:
             try:
                 for line in proc.stderr:
                     line = (line or "").rstrip()
-                    if not line:
+                    if not line or gen != self._gen:
                         continue
                     self.last_stderr_tail.append(line)
-                    if len(self.last_stderr_tail) > 80:
-                        self.last_stderr_tail = self.last_stderr_tail[-80:]
             except Exception:
                 pass
 
@@ -700,7 +969,7 @@ class MediaRunner:
     def debug_text(self) -> str:
         args = self.last_args
         rc = self.last_exit_code
-        tail = self.last_stderr_tail
+        tail = list(self.last_stderr_tail)
         if not args:
             return "No ffplay command yet."
         msg = "Backend: ffplay\n\nCommand:\n" + " ".join(_shell_quote(a) for a in args)
@@ -877,7 +1146,7 @@ class MediaRunner:
         if cue.stop_at_sec is not None and cue.stop_at_sec > pos:
             duration_limit = float(cue.stop_at_sec) - float(pos)
 
-        self.stop()
+        self.stop(wait=False)
         args = self._build_ffplay_args(
             ffplay,
             cue,
@@ -890,6 +1159,13 @@ class MediaRunner:
         self._started_at_monotonic = time.monotonic()
         self._playing_seek_sec = float(pos)
 
+    def seek(self, position_sec: float) -> None:
+        # ffplay has no control channel, so seeking respawns the current cue at the new position.
+        cue = self._playing_cue
+        if cue is None:
+            return
+        self.restart_at(position_sec, volume_override=cue.volume_percent)
+
     def restart_with_volume(self, volume_percent: int) -> None:
         pos = self.playback_position_sec()
         if pos is None:
@@ -1093,7 +1369,22 @@ end run
     return
 
 
+def _probe_duration_in_process(path: str) -> float | None:
+    # Header-only read via mutagen (optional): no ffprobe process spawn for common audio/MP4 files.
+    if not _HAS_MUTAGEN:
+        return None
+    try:
+        f = mutagen.File(path)
+        length = float(f.info.length) if f is not None and getattr(f, "info", None) is not None else 0.0
+    except Exception:
+        return None
+    return length if length > 0 else None
+
+
 def probe_media_duration_sec(path: str, timeout_sec: float = 3.0) -> float | None:
+    dur = _probe_duration_in_process(path)
+    if dur is not None:
+        return dur
     ffprobe = _resolve_fftool("ffprobe")
     if not ffprobe:
         return None
@@ -1123,6 +1414,49 @@ def probe_media_duration_sec(path: str, timeout_sec: float = 3.0) -> float | Non
         return None
 
 
+def _duration_cache_path() -> Path:
+    return _user_data_dir() / "sp_durations.json"
+
+
+def _duration_cache_key(path: str, st: os.stat_result | None = None) -> str | None:
+    # (path, size, mtime) so a replaced/re-exported file is probed again.
+    if st is None:
+        try:
+            st = os.stat(path)
+        except Exception:
+            return None
+    return f"{path}|{st.st_size}|{st.st_mtime_ns}"
+
+
+def _load_duration_cache() -> dict[str, float]:
+    try:
+        data = _read_json_file(_duration_cache_path())
+    except Exception:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # No per-entry stat here (this runs during App startup): lookups build the key from a fresh
+    # stat, so entries for missing or changed files simply never match.
+    out: dict[str, float] = {}
+    for key, dur in data.items():
+        try:
+            out[str(key)] = float(dur)
+        except Exception:
+            continue
+    return out
+
+
+def _save_duration_cache(cache: dict[str, float]) -> None:
+    # Newest entries last; keep the file bounded since stale keys are never pruned by a stat.
+    items = list(cache.items())[-4096:]
+    try:
+        path = _duration_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_file(path, json.dumps(dict(items), ensure_ascii=False).encode("utf-8"))
+    except Exception:
+        pass
+
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -1147,8 +1481,14 @@ class App(tk.Tk):
         self._show_path: Path | None = None
         self._loaded_preset_path: Path | None = None
         self._cues: list[Cue] = []  # Legacy - now using _cues_a and _cues_b
+        self._cue_index: dict[str, int] = {}
         self._loading_editor = False
-        self._duration_cache: dict[str, float] = {}
+        # In-memory LRU (bounded for long sessions); the on-disk cache below keeps everything.
+        self._duration_cache: OrderedDict[str, float] = OrderedDict()
+        self._duration_disk_cache: dict[str, float] = _load_duration_cache()
+        self._duration_disk_save_after_id: str | None = None
+        self._probe_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="probe")
+        self._pending_probes: set[str] = set()
         self._current_duration: float | None = None
         self._was_playing = False
         self._was_playing_a = False
@@ -1164,7 +1504,14 @@ class App(tk.Tk):
         self._analysis_progress_var: tk.DoubleVar = tk.DoubleVar(value=0.0)
         self._analysis_progress_text_var: tk.StringVar = tk.StringVar(value="")
         self._analysis_progressbar = None
+        self._analysis_progress_dirty: bool = False
+        self._last_progress_set: tuple[int, int] | None = None
+        self._ui_drain_after_id: str | None = None
+        self._ui_flush_after_id: str | None = None
         self._vol_restart_after_id: str | None = None
+        # Start-volume slider drags: (cue, value) written once the drag settles.
+        self._pending_cue_vol: tuple[Cue, int] | None = None
+        self._cue_vol_after_id: str | None = None
         self._paused_cue_id: str | None = None
         self._paused_kind: CueKind | None = None
         self._paused_pos_sec: float | None = None
@@ -1174,6 +1521,7 @@ class App(tk.Tk):
         self._preview_proc: subprocess.Popen | None = None
         self._preview_debounce_after_id: str | None = None
         self._preview_request: tuple[str, float, float, int | None] | None = None
+        self._last_preview_args: tuple[str, float, float, int | None] | None = None
         self._loop_a_enabled: bool = False
         self._loop_b_enabled: bool = False
         # Transport button colors (works reliably via tk.Label-based buttons).
@@ -1185,28 +1533,55 @@ class App(tk.Tk):
         self._btn_loop_on_fg = "#111111"
         self._playing_iid_a: str | None = None
         self._playing_iid_b: str | None = None
-        self._cueid_to_iid_a: dict[str, str] = {}
-        self._cueid_to_iid_b: dict[str, str] = {}
+        self._cue_by_id_a: dict[str, Cue] = {}
+        self._cue_by_id_b: dict[str, Cue] = {}
+        self._cue_index_a: dict[str, int] = {}
+        self._cue_index_b: dict[str, int] = {}
         self._now_time_cache: dict[str, str] = {"A": "", "B": ""}
         self._now_fg_cache: dict[str, str | None] = {"A": None, "B": None}
         self._transport_visual_cache: dict[str, tuple[object, ...] | None] = {"A": None, "B": None}
+        # Which _poll_playback sub-updates need to run on the next tick.
+        self._dirty: dict[str, bool] = {
+            "now_playing": True,
+            "vu": True,
+            "waveform": True,
+            "transport": True,
+            "tree_hl": True,
+        }
+        self._poll_state_sig: tuple | None = None
+        self._poll_active_until: float = 0.0
+        self._viewable_cache: dict[str, tuple[float, bool]] = {}
+        self._canvas_dims: dict[str, tuple[int, int]] = {}
         self._vu_profile_cache: dict[str, tuple[int, int, list[float]]] = {}
+        self._vu_db_lut_cache: dict[str, tuple[list[float], list[float]]] = {}
         self._vu_req_inflight: set[str] = set()
         self._loud_req_inflight: set[str] = set()
         self._loud_fail_once: set[str] = set()
         self._loudness_sem = threading.Semaphore(2)
         self._vu_items: dict[str, dict[str, int] | None] = {"A": None, "B": None}
-        self._vu_state: dict[str, dict[str, float]] = {
-            "A": {"level": 0.0, "peak": 0.0, "last_t": float(time.monotonic()), "peak_hold_until": 0.0},
-            "B": {"level": 0.0, "peak": 0.0, "last_t": float(time.monotonic()), "peak_hold_until": 0.0},
-        }
+        self._vu_state_a = VuState(last_t=time.monotonic())
+        self._vu_state_b = VuState(last_t=time.monotonic())
         self._vu_visible: dict[str, bool] = {"A": False, "B": False}
         self._vu_db_cache: dict[str, str] = {"A": "", "B": ""}
+        # Last (coords, fill) sent per VU canvas item, so unchanged segments cost no Tcl calls.
+        self._vu_seg_cache: dict[str, dict[int, tuple]] = {"A": {}, "B": {}}
+        self._vu_gradient_cache: dict[tuple[int, int], tuple[str, ...]] = {}
+        self._vu_last_frame: dict[str, tuple | None] = {"A": None, "B": None}
+        self._vu_seg_ids: dict[str, list[int]] = {"A": [], "B": []}
+        self._norm_snapshot: tuple[bool, float, float | None] | None = None
         self._ui_tasks: queue.SimpleQueue = queue.SimpleQueue()
         self._wave_req_seq: dict[str, int] = {"A": 0, "B": 0}
         self._wave_req_cue_id: dict[str, str | None] = {"A": None, "B": None}
         self._playback_items: dict[str, dict[str, int] | None] = {"A": None, "B": None}
         self._playback_visible: dict[str, bool] = {"A": False, "B": False}
+        self._wave_items: dict[str, dict[str, int] | None] = {"A": None, "B": None}
+        # Decoded waveform images by (path, width, height) they were rendered at; pasted into the deck's photo on reuse.
+        self._waveform_image_cache: dict[tuple[str, int, int], object] = {}
+        self._persistent_wave_photo: dict[str, tuple[object, int, int]] = {}
+        # (cue id, width, height) whose waveform pixels are currently on each deck canvas.
+        self._wave_shown: dict[str, tuple[str, int, int] | None] = {"A": None, "B": None}
+        self._wave_redraw_pending: set[str] = set()
+        self._wave_redraw_after_id: str | None = None
 
         # Global display settings (2nd screen placement + fullscreen)
         self.var_left = tk.StringVar(value=str(self.settings.second_screen_left))
@@ -1216,6 +1591,30 @@ class App(tk.Tk):
             var.trace_add("write", lambda *_: self._apply_settings_from_vars())
 
         self._build_ui()
+        self._deck_ctx: dict[str, DeckCtx] = {
+            "A": DeckCtx(
+                canvas=self.canvas_a,
+                tree=self.tree_a,
+                var_in=self.var_in_a,
+                var_out=self.var_out_a,
+                runner=self.audio_runner,
+                cues_attr="_cues_a",
+                selected_attr="_selected_a",
+                cue_index_attr="_cue_index_a",
+                paused_attr="_paused_a",
+            ),
+            "B": DeckCtx(
+                canvas=self.canvas_b,
+                tree=self.tree_b,
+                var_in=self.var_in_b,
+                var_out=self.var_out_b,
+                runner=self.video_runner,
+                cues_attr="_cues_b",
+                selected_attr="_selected_b",
+                cue_index_attr="_cue_index_b",
+                paused_attr="_paused_b",
+            ),
+        }
         self.after(0, self._bring_to_front)
         self._poll_playback()
         self.after(0, self._startup_sequence)
@@ -1691,6 +2090,7 @@ class App(tk.Tk):
                 self.settings.normalize_true_peak_db = _clamp_float(_ui_to_tp(), tp_min, tp_max, -1.0)
             except Exception:
                 pass
+            self._on_settings_changed()
 
         def _analyze_missing() -> None:
             _apply_audio_settings()
@@ -1708,6 +2108,7 @@ class App(tk.Tk):
             self._analysis_batch_total = int(len(todo))
             self._analysis_batch_done = 0
             try:
+                self._last_progress_set = None
                 self._analysis_progress_var.set(0.0)
                 self._analysis_progress_text_var.set("0/0" if self._analysis_batch_total <= 0 else f"0/{self._analysis_batch_total}")
             except Exception:
@@ -2502,6 +2903,31 @@ class App(tk.Tk):
         ttk.Button(ppt_nav_b, text="▶", command=ppt_next_slide, width=5).pack(side="left", expand=True, fill="x", padx=(2, 0))
         ttk.Button(ppt_b, text="⏹ End", command=ppt_end_show, width=10).pack(fill="x", pady=(2, 0))
 
+        # Per-deck widget refs for the per-tick visual updates (bound once, not looked up each frame).
+        self._deck_widgets: dict[str, dict[str, object]] = {
+            deck: {
+                "play": getattr(self, f"btn_play_{suffix}", None),
+                "stop": getattr(self, f"btn_stop_{suffix}", None),
+                "loop": getattr(self, f"btn_loop_{suffix}", None),
+                "var_play": getattr(self, f"var_play_{suffix}", None),
+                "vu_canvas": getattr(self, f"vu_canvas_{suffix}", None),
+                "var_vu_db": getattr(self, f"var_vu_{suffix}_db", None),
+            }
+            for deck, suffix in (("A", "a"), ("B", "b"))
+        }
+        # Canvas sizes for the per-frame drawing, kept current by <Configure> instead of winfo queries.
+        for deck, suffix in (("A", "a"), ("B", "b")):
+            for key, canvas in (
+                (f"wave_{deck}", getattr(self, f"canvas_{suffix}", None)),
+                (f"vu_{deck}", getattr(self, f"vu_canvas_{suffix}", None)),
+            ):
+                if canvas is not None:
+                    canvas.bind(
+                        "<Configure>",
+                        lambda e, k=key: self._canvas_dims.__setitem__(k, (int(e.width), int(e.height))),
+                        add="+",
+                    )
+
         # Default states for per-cue setup controls (no selection yet).
         self._sync_target_setting_controls("A", None)
         self._sync_target_setting_controls("B", None)
@@ -2528,6 +2954,9 @@ class App(tk.Tk):
                 self.audio_runner.stop()
             if hasattr(self, 'video_runner'):
                 self.video_runner.stop()
+            if self._duration_disk_save_after_id is not None:
+                self._flush_duration_cache()
+            self._probe_pool.shutdown(wait=False, cancel_futures=True)
             if hasattr(self, "_stop_preview"):
                 self._stop_preview()
             self._log("Shutting down...")
@@ -2544,7 +2973,7 @@ class App(tk.Tk):
     # ── Dual Deck Data Management ───────────────────────────────────────
     def _on_deck_a_select(self):
         sel = self.tree_a.selection()
-        self._selected_a = int(sel[0]) if sel else -1
+        self._selected_a = self._cue_index_a.get(sel[0], -1) if sel else -1
         if self._selected_a >= 0:
             self._load_cue_into_editor(self._cues_a[self._selected_a])
             # Generate waveform for selected audio/video
@@ -2567,7 +2996,7 @@ class App(tk.Tk):
 
     def _on_deck_b_select(self):
         sel = self.tree_b.selection()
-        self._selected_b = int(sel[0]) if sel else -1
+        self._selected_b = self._cue_index_b.get(sel[0], -1) if sel else -1
         if self._selected_b >= 0:
             self._load_cue_into_editor(self._cues_b[self._selected_b])
             # Generate waveform for selected audio/video
@@ -2625,7 +3054,7 @@ class App(tk.Tk):
             self._log(f"Deck {deck}: IN adjusted to {_format_timecode(cue.start_sec, with_ms=True)}")
 
             if cue.kind in ("audio", "video"):
-                self._refresh_waveform_markers(cue, canvas, deck)
+                self._schedule_wave_redraw(deck)
 
         except Exception as e:
             try:
@@ -2661,7 +3090,7 @@ class App(tk.Tk):
                 else:
                     self.var_out_b.set("—")
                 if cue.kind in ("audio", "video"):
-                    self._refresh_waveform_markers(cue, canvas, deck)
+                    self._schedule_wave_redraw(deck)
                 return
 
             # Parse timecode
@@ -2685,7 +3114,7 @@ class App(tk.Tk):
             self._log(f"Deck {deck}: OUT adjusted to {_format_timecode(cue.stop_at_sec, with_ms=True)}")
 
             if cue.kind in ("audio", "video"):
-                self._refresh_waveform_markers(cue, canvas, deck)
+                self._schedule_wave_redraw(deck)
 
         except Exception as e:
             try:
@@ -2710,54 +3139,101 @@ class App(tk.Tk):
             return 0.10
         return 0.05
 
+    def _schedule_wave_redraw(self, deck: str) -> None:
+        # Marker edits (clicks, nudges, wheel, typed IN/OUT) are coalesced into one redraw per ~16 ms.
+        self._wave_redraw_pending.add(deck)
+        if self._wave_redraw_after_id is not None:
+            return
+        try:
+            self._wave_redraw_after_id = self.after(16, self._flush_wave_redraw)
+        except Exception:
+            self._wave_redraw_after_id = None
+            self._flush_wave_redraw()
+
+    def _flush_wave_redraw(self) -> None:
+        self._wave_redraw_after_id = None
+        decks = sorted(self._wave_redraw_pending)
+        self._wave_redraw_pending.clear()
+        for deck in decks:
+            cue = self._selected_cue_for_deck(deck)
+            if cue is None or cue.kind not in ("audio", "video"):
+                continue
+            try:
+                self._refresh_waveform_markers(cue, self._deck_ctx[deck].canvas, deck)
+            except Exception:
+                continue
+        if decks:
+            self._mark_dirty("waveform")
+            self._schedule_ui_flush()
+
     def _refresh_waveform_markers(self, cue: Cue, canvas: tk.Canvas, deck_name: str) -> None:
+        # IN/OUT edits and clicks only move the marker overlay; the waveform pixels are
+        # re-blitted only when a different cue or canvas size is showing.
+        width, height = self._canvas_size(f"wave_{deck_name}", canvas)
+        if width < 10 or height < 10:
+            width, height = 600, 60
+        items = self._wave_items.get(deck_name)
         try:
-            images = getattr(self, "_waveform_images", None)
-            has_image = bool(images and images.get(deck_name))
+            image_alive = bool(items and canvas.type(items["image"]))
         except Exception:
-            has_image = False
-        if has_image:
+            image_alive = False
+        if image_alive and self._wave_shown.get(deck_name) == (cue.id, width, height):
             self._update_waveform_markers(cue, canvas)
             return
         self._request_waveform_generate(deck_name, cue)
 
+    def _ensure_wave_items(self, deck: str, canvas: tk.Canvas) -> dict[str, int]:
+        # Waveform image + IN/OUT markers are created once and then only moved/reconfigured.
+        items = self._wave_items.get(deck)
+        if items and canvas.type(items["image"]):
+            return items
+
+        image = canvas.create_image(0, 0, anchor="nw", state="hidden", tags=("waveform",))
+        in_line = canvas.create_line(0, 0, 0, 0, fill="#00ff00", width=2, state="hidden", tags=("marker",))
+        in_text = canvas.create_text(
+            0, 5, text="", anchor="nw", fill="#00ff00", font=("Arial", 8, "bold"), state="hidden", tags=("marker",)
+        )
+        out_line = canvas.create_line(0, 0, 0, 0, fill="#ff0000", width=2, state="hidden", tags=("marker",))
+        out_text = canvas.create_text(
+            0, 0, text="", anchor="sw", fill="#ff0000", font=("Arial", 8, "bold"), state="hidden", tags=("marker",)
+        )
+        canvas.tag_lower(image)
+        items = {"image": image, "in": in_line, "in_text": in_text, "out": out_line, "out_text": out_text}
+        self._wave_items[deck] = items
+        return items
+
     def _update_waveform_markers(self, cue: Cue, canvas: tk.Canvas) -> None:
         try:
-            canvas.delete("marker")
+            deck = "A" if canvas is self.canvas_a else "B"
+            items = self._ensure_wave_items(deck, canvas)
             duration = self._duration_for_cue(cue)
             if not duration or duration <= 0:
+                canvas.itemconfigure("marker", state="hidden")
                 return
-            width = canvas.winfo_width()
-            height = canvas.winfo_height()
+            width, height = self._canvas_size(f"wave_{deck}", canvas)
             if width < 10 or height < 10:
                 width = 600
                 height = 60
 
             if cue.start_sec:
                 x = int((cue.start_sec / duration) * width)
-                canvas.create_line(x, 0, x, height, fill="#00ff00", width=2, tags=("marker",))
-                canvas.create_text(
-                    x,
-                    5,
-                    text=f"IN: {_format_timecode(cue.start_sec, with_ms=True)}",
-                    anchor="nw",
-                    fill="#00ff00",
-                    font=("Arial", 8, "bold"),
-                    tags=("marker",),
-                )
+                canvas.coords(items["in"], x, 0, x, height)
+                canvas.coords(items["in_text"], x, 5)
+                canvas.itemconfigure(items["in_text"], text=f"IN: {_format_timecode(cue.start_sec, with_ms=True)}", state="normal")
+                canvas.itemconfigure(items["in"], state="normal")
+            else:
+                canvas.itemconfigure(items["in"], state="hidden")
+                canvas.itemconfigure(items["in_text"], state="hidden")
 
             if cue.stop_at_sec:
                 x = int((cue.stop_at_sec / duration) * width)
-                canvas.create_line(x, 0, x, height, fill="#ff0000", width=2, tags=("marker",))
-                canvas.create_text(
-                    x,
-                    height - 5,
-                    text=f"OUT: {_format_timecode(cue.stop_at_sec, with_ms=True)}",
-                    anchor="sw",
-                    fill="#ff0000",
-                    font=("Arial", 8, "bold"),
-                    tags=("marker",),
-                )
+                canvas.coords(items["out"], x, 0, x, height)
+                canvas.coords(items["out_text"], x, height - 5)
+                canvas.itemconfigure(items["out_text"], text=f"OUT: {_format_timecode(cue.stop_at_sec, with_ms=True)}", state="normal")
+                canvas.itemconfigure(items["out"], state="normal")
+            else:
+                canvas.itemconfigure(items["out"], state="hidden")
+                canvas.itemconfigure(items["out_text"], state="hidden")
         except Exception:
             return
 
@@ -2765,11 +3241,7 @@ class App(tk.Tk):
         if cue.kind not in ("audio", "video"):
             return
         canvas = self.canvas_a if deck == "A" else self.canvas_b
-        try:
-            width = int(canvas.winfo_width() or 0)
-            height = int(canvas.winfo_height() or 0)
-        except Exception:
-            width, height = 0, 0
+        width, height = self._canvas_size(f"wave_{deck}", canvas)
         if width < 10 or height < 10:
             width, height = 600, 60
 
@@ -2777,6 +3249,13 @@ class App(tk.Tk):
         token = int(self._wave_req_seq[deck])
         self._wave_req_cue_id[deck] = cue.id
 
+        # Re-selecting a cue that was already rendered at this size: no ffmpeg run.
+        req_size = (width, height)
+        cached = self._waveform_image_cache.get((cue.path, width, height))
+        if cached is not None:
+            self._apply_waveform_result(deck, cue.id, token, None, None, image=cached, req_size=req_size)
+            return
+
         def _worker():
             png_bytes: bytes | None = None
             err_text: str | None = None
@@ -2809,15 +3288,11 @@ class App(tk.Tk):
             except Exception as e:
                 err_text = str(e)
 
-            self._ui_tasks.put(lambda: self._apply_waveform_result(deck, cue.id, token, png_bytes, err_text))
+            self._ui_tasks.put(lambda: self._apply_waveform_result(deck, cue.id, token, png_bytes, err_text, req_size=req_size))
 
         threading.Thread(target=_worker, daemon=True).start()
 
     def _compute_vu_levels_from_image(self, img) -> list[float]:
-        try:
-            from PIL import Image
-        except Exception:
-            Image = None  # type: ignore[assignment]
         try:
             rgba = img.convert("RGBA")
         except Exception:
@@ -2828,11 +3303,30 @@ class App(tk.Tk):
             return []
         if w <= 0 or h <= 0:
             return []
-        px = rgba.load()
         mid = h / 2.0
         half = max(1.0, h / 2.0)
         levels: list[float] = [0.0] * int(w)
 
+        # Build the "waveform pixel" mask in C (alpha >= 10 and r+g+b >= 60), then only the
+        # top/bottom extent of each column is needed: those are the max deviations from mid.
+        try:
+            r, g, b, a = rgba.split()
+            lum = ImageChops.add(ImageChops.add(r, g), b)  # clips at 255, threshold is far below
+            mask = ImageChops.multiply(
+                lum.point(lambda v: 255 if v >= 60 else 0),
+                a.point(lambda v: 255 if v >= 10 else 0),
+            )
+            for x in range(int(w)):
+                box = mask.crop((x, 0, x + 1, h)).getbbox()
+                if box is None:
+                    continue
+                max_dev = max(abs(float(box[1]) - mid), abs(float(box[3] - 1) - mid))
+                levels[x] = max(0.0, min(1.0, max_dev / half))
+            return levels
+        except Exception:
+            levels = [0.0] * int(w)
+
+        px = rgba.load()
         # Background is typically black; waveform is bright blue. Use a simple luminance threshold.
         for x in range(int(w)):
             max_dev = 0.0
@@ -2865,10 +3359,8 @@ class App(tk.Tk):
             if b <= a:
                 b = a + 1
             b = min(len(levels), b)
-            m = 0.0
-            for v in levels[a:b]:
-                if v > m:
-                    m = float(v)
+            # Per-bin peak via the C-level max over a slice instead of a Python compare loop.
+            m = float(max(levels[a:b], default=0.0))
             out.append(max(0.0, min(1.0, m)))
         return out
 
@@ -2884,6 +3376,15 @@ class App(tk.Tk):
                 continue
         return out
 
+    def _set_vu_profile(self, cue_id: str, levels: list[float]) -> float:
+        # levels are already floats (dequantized/downsampled), so no per-element casts or copies.
+        try:
+            peak = float(max(levels, default=0.0))
+        except Exception:
+            peak = 0.0
+        self._vu_profile_cache[cue_id] = (int(len(levels)), peak, levels)
+        return peak
+
     def _request_vu_profile(self, cue: Cue) -> None:
         if cue.kind not in ("audio", "video"):
             return
@@ -2892,12 +3393,7 @@ class App(tk.Tk):
         if cue.vu_profile_q:
             levels = self._dequantize_levels(cue.vu_profile_q)
             if levels:
-                peak = 0.0
-                try:
-                    peak = max(float(v) for v in levels) if levels else 0.0
-                except Exception:
-                    peak = 0.0
-                self._vu_profile_cache[cue.id] = (int(len(levels)), float(peak), list(levels))
+                self._set_vu_profile(cue.id, levels)
                 return
         if cue.id in self._vu_req_inflight:
             return
@@ -2930,9 +3426,8 @@ class App(tk.Tk):
                 result = subprocess.run(cmd, capture_output=True, timeout=10)
                 if result.returncode == 0 and result.stdout:
                     try:
-                        from io import BytesIO
-                        from PIL import Image
-
+                        if not _HAS_PIL:
+                            raise RuntimeError("Pillow not available")
                         img = Image.open(BytesIO(result.stdout))
                         levels = self._compute_vu_levels_from_image(img)
                     except Exception as e:
@@ -2949,12 +3444,7 @@ class App(tk.Tk):
                     pass
                 if levels:
                     down = self._downsample_levels(levels, 240)
-                    peak = 0.0
-                    try:
-                        peak = max(float(v) for v in down) if down else 0.0
-                    except Exception:
-                        peak = 0.0
-                    self._vu_profile_cache[cue.id] = (int(len(down)), float(peak), list(down))
+                    self._set_vu_profile(cue.id, down)
                     try:
                         cue.vu_profile_q = self._quantize_levels(down)
                     except Exception:
@@ -3060,17 +3550,8 @@ class App(tk.Tk):
                     try:
                         self._analysis_batch_ids.discard(cue.id)
                         self._analysis_batch_done = int(self._analysis_batch_done) + 1
-                        total = int(self._analysis_batch_total)
-                        done = int(self._analysis_batch_done)
-                        self._analysis_progress_var.set(float(done))
-                        self._analysis_progress_text_var.set(f"{done}/{total}" if total > 0 else "0/0")
-                        try:
-                            if self._analysis_progressbar is not None and self._analysis_progressbar.winfo_exists():
-                                self._analysis_progressbar.configure(maximum=max(1, total))
-                        except Exception:
-                            pass
-                        if total > 0 and done >= total:
-                            self._analysis_progress_text_var.set("Done")
+                        # Widgets are updated once per drained batch (see _flush_analysis_progress).
+                        self._analysis_progress_dirty = True
                     except Exception:
                         pass
 
@@ -3085,59 +3566,34 @@ class App(tk.Tk):
         token: int,
         png_bytes: bytes | None,
         err_text: str | None,
+        image=None,
+        req_size: tuple[int, int] | None = None,
     ) -> None:
         # Only apply the latest request for that deck and only if the cue is still selected.
-        try:
-            if int(self._wave_req_seq.get(deck, 0)) != int(token):
-                return
-            if self._wave_req_cue_id.get(deck) != cue_id:
-                return
-        except Exception:
+        if self._wave_req_seq.get(deck, 0) != token or self._wave_req_cue_id.get(deck) != cue_id:
             return
-
-        if deck == "A":
-            cue = self._cues_a[self._selected_a] if 0 <= self._selected_a < len(self._cues_a) else None
-            canvas = self.canvas_a
-        else:
-            cue = self._cues_b[self._selected_b] if 0 <= self._selected_b < len(self._cues_b) else None
-            canvas = self.canvas_b
-
+        cue = self._selected_cue_for_deck(deck)
         if cue is None or cue.id != cue_id:
             return
+        canvas = self._deck_ctx[deck].canvas
+        if not canvas.winfo_exists():
+            return
 
-        try:
-            canvas.delete("all")
-        except Exception:
-            pass
-
-        # The canvas got cleared, so any cached playback item ids are now invalid.
-        try:
-            self._playback_items[deck] = None
-        except Exception:
-            pass
+        canvas.delete("wave_msg")
+        items = self._ensure_wave_items(deck, canvas)
 
-        width = max(1, int(canvas.winfo_width() or 1))
-        height = max(1, int(canvas.winfo_height() or 1))
+        width, height = self._canvas_size(f"wave_{deck}", canvas)
         if width < 10 or height < 10:
             width, height = 600, 60
 
-        photo = None
-        if png_bytes:
+        if image is None and png_bytes and _HAS_PIL:
             try:
-                from io import BytesIO
-                from PIL import Image, ImageTk
-
                 img = Image.open(BytesIO(png_bytes))
                 try:
                     levels = self._compute_vu_levels_from_image(img)
                     if levels:
                         down = self._downsample_levels(levels, 240)
-                        peak = 0.0
-                        try:
-                            peak = max(float(v) for v in down) if down else 0.0
-                        except Exception:
-                            peak = 0.0
-                        self._vu_profile_cache[cue_id] = (int(len(down)), float(peak), list(down))
+                        self._set_vu_profile(cue_id, down)
                         try:
                             cue.vu_profile_q = self._quantize_levels(down)
                         except Exception:
@@ -3145,56 +3601,77 @@ class App(tk.Tk):
                         self._vu_req_inflight.discard(cue_id)
                 except Exception:
                     pass
-                photo = ImageTk.PhotoImage(img)
+                img.load()
+                image = img
+                cache = self._waveform_image_cache
+                if len(cache) >= 64:
+                    cache.pop(next(iter(cache)))
+                # Keyed by the size ffmpeg rendered at, which may differ from the canvas by now.
+                req_w, req_h = req_size or img.size
+                cache[(cue.path, req_w, req_h)] = img
             except Exception:
-                photo = None
+                image = None
 
-        if photo is not None:
+        if image is not None and image.size != (width, height):
+            # Canvas was resized since the request; stretch so markers line up with the pixels.
             try:
-                if not hasattr(self, "_waveform_images"):
-                    self._waveform_images = {}
-                self._waveform_images[deck] = photo
+                image = image.resize((width, height))
             except Exception:
-                pass
+                image = None
+
+        photo = None
+        if image is not None:
             try:
-                canvas.create_image(0, 0, anchor="nw", image=photo, tags=("waveform",))
+                photo = self._wave_photo_for(deck, image)
             except Exception:
-                pass
+                photo = None
+
+        if photo is not None:
+            canvas.itemconfigure(items["image"], image=photo, state="normal")
+            self._wave_shown[deck] = (cue.id, width, height)
             self._update_waveform_markers(cue, canvas)
-            self._update_waveform_playback_visuals()
+            self._mark_dirty("waveform")
+            self._schedule_ui_flush()
         else:
-            try:
-                canvas.create_text(
-                    width // 2,
-                    height // 2,
-                    text="Waveform preview unavailable",
-                    fill="#888888",
-                    font=("Arial", 10),
-                )
-            except Exception:
-                pass
+            self._wave_shown[deck] = None
+            canvas.itemconfigure(items["image"], state="hidden")
+            canvas.itemconfigure("marker", state="hidden")
+            self._clear_waveform_playback(deck, canvas)
+            canvas.create_text(
+                width // 2,
+                height // 2,
+                text="Waveform preview unavailable",
+                fill="#888888",
+                font=("Arial", 10),
+                tags=("wave_msg",),
+            )
             if err_text:
                 try:
                     self._log(f"Deck {deck}: Waveform preview unavailable ({err_text.strip()[:120]})")
                 except Exception:
                     pass
 
+    def _wave_photo_for(self, deck: str, img):
+        # Keep one Tk photo per deck and paste new pixels into it while the size is unchanged.
+        w, h = img.size
+        entry = self._persistent_wave_photo.get(deck)
+        if entry is not None and entry[1] == w and entry[2] == h:
+            photo = entry[0]
+            photo.paste(img)
+            return photo
+        photo = ImageTk.PhotoImage(img)
+        self._persistent_wave_photo[deck] = (photo, int(w), int(h))
+        return photo
+
     def _nudge_in(self, deck: str, delta_sec: float) -> None:
         try:
-            if deck == "A":
-                if self._selected_a < 0 or self._selected_a >= len(self._cues_a):
-                    return
-                cue = self._cues_a[self._selected_a]
-                var_in = self.var_in_a
-                var_out = self.var_out_a
-                canvas = self.canvas_a
-            else:
-                if self._selected_b < 0 or self._selected_b >= len(self._cues_b):
-                    return
-                cue = self._cues_b[self._selected_b]
-                var_in = self.var_in_b
-                var_out = self.var_out_b
-                canvas = self.canvas_b
+            ctx = self._deck_ctx[deck]
+            cue = self._selected_cue_for_deck(deck)
+            if cue is None:
+                return
+            var_in = ctx.var_in
+            var_out = ctx.var_out
+            canvas = ctx.canvas
 
             base = _parse_timecode(var_in.get())
             current = cue.start_sec if base is None else float(base)
@@ -3210,27 +3687,20 @@ class App(tk.Tk):
             var_in.set(_format_timecode(cue.start_sec, with_ms=True))
             self._update_tree_item(cue)
             if cue.kind in ("audio", "video"):
-                self._refresh_waveform_markers(cue, canvas, deck)
+                self._schedule_wave_redraw(deck)
                 self._request_cue_preview_in(cue)
         except Exception as e:
             self._log(f"IN nudge error: {e}")
 
     def _nudge_out(self, deck: str, delta_sec: float) -> None:
         try:
-            if deck == "A":
-                if self._selected_a < 0 or self._selected_a >= len(self._cues_a):
-                    return
-                cue = self._cues_a[self._selected_a]
-                var_out = self.var_out_a
-                var_in = self.var_in_a
-                canvas = self.canvas_a
-            else:
-                if self._selected_b < 0 or self._selected_b >= len(self._cues_b):
-                    return
-                cue = self._cues_b[self._selected_b]
-                var_out = self.var_out_b
-                var_in = self.var_in_b
-                canvas = self.canvas_b
+            ctx = self._deck_ctx[deck]
+            cue = self._selected_cue_for_deck(deck)
+            if cue is None:
+                return
+            var_out = ctx.var_out
+            var_in = ctx.var_in
+            canvas = ctx.canvas
 
             base = _parse_timecode(var_out.get())
             if base is None:
@@ -3249,7 +3719,7 @@ class App(tk.Tk):
             var_out.set(_format_timecode(cue.stop_at_sec, with_ms=True))
             self._update_tree_item(cue)
             if cue.kind in ("audio", "video"):
-                self._refresh_waveform_markers(cue, canvas, deck)
+                self._schedule_wave_redraw(deck)
                 self._request_cue_preview_out(cue)
         except Exception as e:
             self._log(f"OUT nudge error: {e}")
@@ -3281,6 +3751,7 @@ class App(tk.Tk):
             except Exception:
                 pass
             self._preview_debounce_after_id = None
+        self._last_preview_args = None
         proc = self._preview_proc
         self._preview_proc = None
         if proc is None:
@@ -3344,6 +3815,7 @@ class App(tk.Tk):
                 stderr=subprocess.DEVNULL,
                 text=False,
             )
+            self._last_preview_args = (path, start_sec, duration_sec, volume_override)
             self.after(150, self._preview_poll)
         except Exception:
             self._preview_proc = None
@@ -3358,7 +3830,15 @@ class App(tk.Tk):
         self._start_preview(path, start, dur, vol)
 
     def _request_preview(self, path: str, start_sec: float, duration_sec: float, volume_override: int | None = None) -> None:
-        self._preview_request = (path, float(start_sec), float(duration_sec), volume_override)
+        args = (path, round(float(start_sec), 3), round(float(duration_sec), 3), volume_override)
+        # Nudges that round to the same IN/OUT would only re-spawn an identical preview.
+        if args == self._last_preview_args:
+            proc = self._preview_proc
+            if proc is not None and proc.poll() is None:
+                return
+        if args == self._preview_request and self._preview_debounce_after_id is not None:
+            return
+        self._preview_request = args
         if self._preview_debounce_after_id is not None:
             try:
                 self.after_cancel(self._preview_debounce_after_id)
@@ -3397,31 +3877,39 @@ class App(tk.Tk):
 
     def _refresh_tree_a(self):
         self.tree_a.delete(*self.tree_a.get_children())
-        self._cueid_to_iid_a = {}
-        for i, cue in enumerate(self._cues_a):
-            iid = str(i)
-            self._cueid_to_iid_a[cue.id] = iid
-            self.tree_a.insert("", "end", iid=iid, values=(
+        cues = self._cues_a
+        self._cue_by_id_a = {c.id: c for c in cues}
+        self._cue_index_a = {c.id: i for i, c in enumerate(cues)}
+        # Rows are rebuilt without tags, so the playing row has to be re-tagged.
+        self._playing_iid_a = None
+        starts = _format_timecode_column([cue.start_sec for cue in cues], "0:00")
+        stops = _format_timecode_column([cue.stop_at_sec for cue in cues], "—")
+        for i, cue in enumerate(cues):
+            self.tree_a.insert("", "end", iid=cue.id, values=(
                 i+1,
                 cue.kind,
-                _shorten_middle(Path(cue.path).name, 64),
-                _format_timecode(cue.start_sec),
-                _format_timecode(cue.stop_at_sec) if cue.stop_at_sec else "—"
+                cue.display_short,
+                starts[i],
+                stops[i]
             ))
         self._update_tree_playing_highlight()
 
     def _refresh_tree_b(self):
         self.tree_b.delete(*self.tree_b.get_children())
-        self._cueid_to_iid_b = {}
-        for i, cue in enumerate(self._cues_b):
-            iid = str(i)
-            self._cueid_to_iid_b[cue.id] = iid
-            self.tree_b.insert("", "end", iid=iid, values=(
+        cues = self._cues_b
+        self._cue_by_id_b = {c.id: c for c in cues}
+        self._cue_index_b = {c.id: i for i, c in enumerate(cues)}
+        # Rows are rebuilt without tags, so the playing row has to be re-tagged.
+        self._playing_iid_b = None
+        starts = _format_timecode_column([cue.start_sec for cue in cues], "0:00")
+        stops = _format_timecode_column([cue.stop_at_sec for cue in cues], "—")
+        for i, cue in enumerate(cues):
+            self.tree_b.insert("", "end", iid=cue.id, values=(
                 i+1,
                 cue.kind,
-                _shorten_middle(Path(cue.path).name, 64),
-                _format_timecode(cue.start_sec),
-                _format_timecode(cue.stop_at_sec) if cue.stop_at_sec else "—"
+                cue.display_short,
+                starts[i],
+                stops[i]
             ))
         self._update_tree_playing_highlight()
 
@@ -3438,6 +3926,7 @@ class App(tk.Tk):
                   fade_at_sec=None, fade_dur_sec=5.0, fade_to_percent=100, open_on_second_screen=False)
         self._cues_a.append(cue)
         self._refresh_tree_a()
+        self._prefetch_durations([cue])
         self._log(f"Deck A: Added {kind} - {Path(path).name}")
 
     def _add_cue_b(self, kind: CueKind):
@@ -3453,6 +3942,7 @@ class App(tk.Tk):
                   fade_at_sec=None, fade_dur_sec=5.0, fade_to_percent=100, open_on_second_screen=False)
         self._cues_b.append(cue)
         self._refresh_tree_b()
+        self._prefetch_durations([cue])
         self._log(f"Deck B: Added {kind} - {Path(path).name}")
 
     def _remove_a(self):
@@ -3487,10 +3977,16 @@ class App(tk.Tk):
         j = self._selected_a + delta
         if j < 0 or j >= len(self._cues_a):
             return
-        self._cues_a[self._selected_a], self._cues_a[j] = self._cues_a[j], self._cues_a[self._selected_a]
+        i = self._selected_a
+        cues = self._cues_a
+        cues[i], cues[j] = cues[j], cues[i]
         self._selected_a = j
-        self._refresh_tree_a()
-        self.tree_a.selection_set(str(j))
+        # Rows are keyed by cue id, so a reorder is a single row move plus renumbering the pair.
+        for k in (i, j):
+            self._cue_index_a[cues[k].id] = k
+            self.tree_a.set(cues[k].id, "idx", k + 1)
+        self.tree_a.move(cues[j].id, "", j)
+        self.tree_a.selection_set(cues[j].id)
 
     def _move_b(self, delta: int):
         if self._selected_b < 0:
@@ -3498,10 +3994,16 @@ class App(tk.Tk):
         j = self._selected_b + delta
         if j < 0 or j >= len(self._cues_b):
             return
-        self._cues_b[self._selected_b], self._cues_b[j] = self._cues_b[j], self._cues_b[self._selected_b]
+        i = self._selected_b
+        cues = self._cues_b
+        cues[i], cues[j] = cues[j], cues[i]
         self._selected_b = j
-        self._refresh_tree_b()
-        self.tree_b.selection_set(str(j))
+        # Rows are keyed by cue id, so a reorder is a single row move plus renumbering the pair.
+        for k in (i, j):
+            self._cue_index_b[cues[k].id] = k
+            self.tree_b.set(cues[k].id, "idx", k + 1)
+        self.tree_b.move(cues[j].id, "", j)
+        self.tree_b.selection_set(cues[j].id)
 
     def _play_deck_a(self):
         self._transport_play_pause("A")
@@ -3516,25 +4018,30 @@ class App(tk.Tk):
         self._transport_stop("B")
 
     def _deck_runner(self, deck: str) -> MediaRunner:
-        return self.audio_runner if deck == "A" else self.video_runner
+        return self._deck_ctx[deck].runner
 
     def _selected_cue_for_deck(self, deck: str) -> Cue | None:
-        if deck == "A":
-            if 0 <= self._selected_a < len(self._cues_a):
-                return self._cues_a[self._selected_a]
-            return None
-        if 0 <= self._selected_b < len(self._cues_b):
-            return self._cues_b[self._selected_b]
+        ctx = self._deck_ctx[deck]
+        cues = getattr(self, ctx.cues_attr)
+        idx = getattr(self, ctx.selected_attr)
+        if 0 <= idx < len(cues):
+            return cues[idx]
         return None
 
+    def _is_selected_cue_paused(self, deck: str) -> bool:
+        # Selection lives in _selected_a/_selected_b (kept by the <<TreeviewSelect>> handlers),
+        # so no Treeview round-trip is needed; only resolve the cue when something is paused.
+        paused = self._paused_state_for_deck(deck)
+        if paused is None:
+            return False
+        sel = self._selected_cue_for_deck(deck)
+        return sel is not None and paused[0] == sel.id
+
     def _paused_state_for_deck(self, deck: str) -> tuple[str, float] | None:
-        return self._paused_a if deck == "A" else self._paused_b
+        return getattr(self, self._deck_ctx[deck].paused_attr)
 
     def _set_paused_state_for_deck(self, deck: str, state: tuple[str, float] | None) -> None:
-        if deck == "A":
-            self._paused_a = state
-        else:
-            self._paused_b = state
+        setattr(self, self._deck_ctx[deck].paused_attr, state)
 
     def _transport_play_pause(self, deck: str) -> None:
         runner = self._deck_runner(deck)
@@ -3732,7 +4239,6 @@ class App(tk.Tk):
                 return
             v = int(round(float(var.get())))
             v = _clamp_int(v, 0, 100)
-            cue.volume_percent = v
             if label is not None:
                 try:
                     label.set(str(v))
@@ -3740,6 +4246,31 @@ class App(tk.Tk):
                     pass
         except Exception:
             return
+        # Slider drags fire many events; keep only the latest value and apply it once the drag settles.
+        pending = self._pending_cue_vol
+        if pending is not None and pending[0] is not cue:
+            self._apply_pending_cue_volume()
+        self._pending_cue_vol = (cue, v)
+        if self._cue_vol_after_id is not None:
+            try:
+                self.after_cancel(self._cue_vol_after_id)
+            except Exception:
+                pass
+        self._cue_vol_after_id = self.after(180, self._apply_pending_cue_volume)
+
+    def _apply_pending_cue_volume(self) -> None:
+        if self._cue_vol_after_id is not None:
+            try:
+                self.after_cancel(self._cue_vol_after_id)
+            except Exception:
+                pass
+            self._cue_vol_after_id = None
+        pending = self._pending_cue_vol
+        self._pending_cue_vol = None
+        if pending is None:
+            return
+        cue, v = pending
+        cue.volume_percent = v
 
     # Legacy compatibility stubs
     def _selected_cue(self) -> Cue | None:
@@ -3764,61 +4295,57 @@ class App(tk.Tk):
             "Y" if cue.open_on_second_screen else "",
         )
 
+    def _update_tree_cells(self, tree: ttk.Treeview, iid: str, values: tuple) -> None:
+        # Only touch the cells that changed (usually just IN or OUT after a nudge).
+        try:
+            current = tree.set(iid)
+        except Exception:
+            tree.item(iid, values=values)
+            return
+        for col, value in zip(("idx", "kind", "name", "start", "stop"), values):
+            if current.get(col) != str(value):
+                tree.set(iid, col, value)
+
     def _update_tree_item(self, cue: Cue) -> None:
+        self._mark_dirty("now_playing", "waveform")
         # Find which deck the cue belongs to and update the appropriate tree.
         # Important: avoid full tree refresh here because that clears Treeview
         # selection, which is disruptive while setting IN/OUT points.
         try:
-            idx_a: int | None = None
-            iid_a = self._cueid_to_iid_a.get(cue.id)
-            if iid_a is not None:
-                try:
-                    idx_guess = int(iid_a)
-                except Exception:
-                    idx_guess = -1
-                if 0 <= idx_guess < len(self._cues_a) and self._cues_a[idx_guess].id == cue.id:
-                    idx_a = idx_guess
-            if idx_a is None:
+            idx_a = self._cue_index_a.get(cue.id)
+            if idx_a is not None and not (idx_a < len(self._cues_a) and self._cues_a[idx_a] is cue):
                 idx_a = next((i for i, c in enumerate(self._cues_a) if c.id == cue.id), None)
             if idx_a is not None:
-                iid = str(int(idx_a))
+                iid = cue.id
                 stop_txt = _format_timecode(cue.stop_at_sec) if cue.stop_at_sec else "—"
                 values = (
                     int(idx_a) + 1,
                     cue.kind,
-                    _shorten_middle(Path(cue.path).name, 64),
+                    cue.display_short,
                     _format_timecode(cue.start_sec),
                     stop_txt,
                 )
                 if self.tree_a.exists(iid):
-                    self.tree_a.item(iid, values=values)
+                    self._update_tree_cells(self.tree_a, iid, values)
                 else:
                     self._refresh_tree_a()
                 return
 
-            idx_b: int | None = None
-            iid_b = self._cueid_to_iid_b.get(cue.id)
-            if iid_b is not None:
-                try:
-                    idx_guess = int(iid_b)
-                except Exception:
-                    idx_guess = -1
-                if 0 <= idx_guess < len(self._cues_b) and self._cues_b[idx_guess].id == cue.id:
-                    idx_b = idx_guess
-            if idx_b is None:
+            idx_b = self._cue_index_b.get(cue.id)
+            if idx_b is not None and not (idx_b < len(self._cues_b) and self._cues_b[idx_b] is cue):
                 idx_b = next((i for i, c in enumerate(self._cues_b) if c.id == cue.id), None)
             if idx_b is not None:
-                iid = str(int(idx_b))
+                iid = cue.id
                 stop_txt = _format_timecode(cue.stop_at_sec) if cue.stop_at_sec else "—"
                 values = (
                     int(idx_b) + 1,
                     cue.kind,
-                    _shorten_middle(Path(cue.path).name, 64),
+                    cue.display_short,
                     _format_timecode(cue.start_sec),
                     stop_txt,
                 )
                 if self.tree_b.exists(iid):
-                    self.tree_b.item(iid, values=values)
+                    self._update_tree_cells(self.tree_b, iid, values)
                 else:
                     self._refresh_tree_b()
                 return
@@ -3837,14 +4364,107 @@ class App(tk.Tk):
         if cue.kind not in ("audio", "video"):
             return None
         key = cue.path
-        if key in self._duration_cache:
-            return self._duration_cache[key]
+        dur = self._duration_cache.get(key)
+        if dur is not None:
+            self._duration_cache.move_to_end(key)
+            return dur
+        disk_key = _duration_cache_key(cue.path)
+        if disk_key is not None and disk_key in self._duration_disk_cache:
+            dur = self._duration_disk_cache[disk_key]
+            self._remember_duration(key, dur)
+            return dur
         dur = probe_media_duration_sec(cue.path)
         if dur is None:
             return None
-        self._duration_cache[key] = dur
+        self._store_duration(key, disk_key, dur)
         return dur
 
+    def _remember_duration(self, path: str, dur: float) -> None:
+        cache = self._duration_cache
+        cache[path] = dur
+        cache.move_to_end(path)
+        while len(cache) > 512:
+            cache.popitem(last=False)
+
+    def _store_duration(self, path: str, disk_key: str | None, dur: float) -> None:
+        self._remember_duration(path, dur)
+        if disk_key is not None and self._duration_disk_cache.get(disk_key) != dur:
+            self._duration_disk_cache[disk_key] = dur
+            self._schedule_duration_cache_save()
+
+    def _prefetch_durations(self, cues: list[Cue]) -> None:
+        # Probe durations off the UI thread so the first selection of a cue does not stall on ffprobe.
+        paths: list[str] = []
+        for cue in cues:
+            if cue.kind not in ("audio", "video"):
+                continue
+            path = cue.path
+            if path in self._duration_cache or path in self._pending_probes:
+                continue
+            self._pending_probes.add(path)
+            paths.append(path)
+        if not paths:
+            return
+        try:
+            self._probe_pool.submit(self._prefetch_batch, paths)
+        except Exception:
+            self._pending_probes.difference_update(paths)
+
+    def _prefetch_batch(self, paths: list[str]) -> None:
+        # One stat per file: disk-cache hits land in a single UI task, and the misses are queued
+        # smallest file first so most of a freshly loaded show has durations early.
+        hits: list[tuple[str, str, float]] = []
+        misses: list[tuple[float, str, str | None]] = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except Exception:
+                st = None
+            disk_key = _duration_cache_key(path, st) if st is not None else None
+            dur = self._duration_disk_cache.get(disk_key) if disk_key is not None else None
+            if dur is not None:
+                hits.append((path, disk_key, dur))
+            else:
+                misses.append((st.st_size if st is not None else float("inf"), path, disk_key))
+
+        if hits:
+            def _apply_hits() -> None:
+                for path, disk_key, dur in hits:
+                    self._pending_probes.discard(path)
+                    self._store_duration(path, disk_key, dur)
+
+            self._ui_tasks.put(_apply_hits)
+
+        misses.sort(key=lambda m: m[0])
+        for _size, path, disk_key in misses:
+            try:
+                self._probe_pool.submit(self._prefetch_duration, path, disk_key)
+            except Exception:
+                self._ui_tasks.put(lambda p=path: self._pending_probes.discard(p))
+
+    def _prefetch_duration(self, path: str, disk_key: str | None) -> None:
+        dur = probe_media_duration_sec(path)
+
+        def _apply() -> None:
+            self._pending_probes.discard(path)
+            if dur is not None:
+                self._store_duration(path, disk_key, dur)
+
+        self._ui_tasks.put(_apply)
+
+    def _schedule_duration_cache_save(self) -> None:
+        # Coalesce writes when many cues get probed in a row (show load).
+        if self._duration_disk_save_after_id is not None:
+            return
+        try:
+            self._duration_disk_save_after_id = self.after(1000, self._flush_duration_cache)
+        except Exception:
+            self._flush_duration_cache()
+
+    def _flush_duration_cache(self) -> None:
+        self._duration_disk_save_after_id = None
+        _save_duration_cache(dict(self._duration_disk_cache))
+
     def _set_timeline(self, duration: float | None) -> None:
         self._current_duration = duration
         if duration is None:
@@ -3955,8 +4575,10 @@ class App(tk.Tk):
             fade_to_percent=100,
             open_on_second_screen=False,
         )
+        self._cue_index[cue.id] = len(self._cues)
         self._cues.append(cue)
         self._refresh_tree()
+        self._prefetch_durations([cue])
         self.tree.selection_set(cue.id)
         self.tree.see(cue.id)
         self._log(f"Added {cue.kind}: {cue.display_name()}")
@@ -3965,22 +4587,31 @@ class App(tk.Tk):
         cue = self._selected_cue()
         if not cue:
             return
-        self._cues = [c for c in self._cues if c.id != cue.id]
+        idx = self._cue_index.get(cue.id)
+        if idx is None:
+            return
+        del self._cues[idx]
+        self._rebuild_cue_index()
         self._refresh_tree()
         self._load_selected_into_editor()
         self._log(f"Removed: {cue.display_name()}")
 
+    def _rebuild_cue_index(self) -> None:
+        self._cue_index = {c.id: i for i, c in enumerate(self._cues)}
+
     def _move_selected(self, delta: int) -> None:
         cue = self._selected_cue()
         if not cue:
             return
-        idx = next((i for i, c in enumerate(self._cues) if c.id == cue.id), None)
+        idx = self._cue_index.get(cue.id)
         if idx is None:
             return
         j = idx + int(delta)
         if j < 0 or j >= len(self._cues):
             return
         self._cues[idx], self._cues[j] = self._cues[j], self._cues[idx]
+        self._cue_index[self._cues[idx].id] = idx
+        self._cue_index[self._cues[j].id] = j
         self._refresh_tree()
         self.tree.selection_set(cue.id)
         self.tree.see(cue.id)
@@ -4094,9 +4725,7 @@ class App(tk.Tk):
 
         if self._paused_cue_id and self._paused_kind and self._paused_pos_sec is not None:
             # Search for paused cue in both decks
-            cue_obj = next((c for c in self._cues_a if c.id == self._paused_cue_id), None)
-            if cue_obj is None:
-                cue_obj = next((c for c in self._cues_b if c.id == self._paused_cue_id), None)
+            cue_obj = self._cue_by_id(self._paused_cue_id)
             if cue_obj is None:
                 self._paused_cue_id = None
                 self._paused_kind = None
@@ -4123,32 +4752,27 @@ class App(tk.Tk):
 
     def _select_next_after_id(self, cue_id: str) -> bool:
         # Check deck A first
-        ids_a = [c.id for c in self._cues_a]
-        try:
-            idx = ids_a.index(cue_id)
-            if idx + 1 < len(ids_a):
+        idx = self._cue_index_a.get(cue_id)
+        if idx is not None:
+            if idx + 1 < len(self._cues_a):
                 self._selected_a = idx + 1
-                self.tree_a.selection_set(str(self._selected_a))
-                self.tree_a.see(str(self._selected_a))
+                self.tree_a.selection_set(self._cues_a[self._selected_a].id)
+                self.tree_a.see(self._cues_a[self._selected_a].id)
                 self._load_cue_into_editor(self._cues_a[self._selected_a])
                 return True
             return False
-        except ValueError:
-            pass
 
         # Check deck B
-        ids_b = [c.id for c in self._cues_b]
-        try:
-            idx = ids_b.index(cue_id)
-            if idx + 1 < len(ids_b):
+        idx = self._cue_index_b.get(cue_id)
+        if idx is not None:
+            if idx + 1 < len(self._cues_b):
                 self._selected_b = idx + 1
-                self.tree_b.selection_set(str(self._selected_b))
-                self.tree_b.see(str(self._selected_b))
+                self.tree_b.selection_set(self._cues_b[self._selected_b].id)
+                self.tree_b.see(self._cues_b[self._selected_b].id)
                 self._load_cue_into_editor(self._cues_b[self._selected_b])
                 return True
             return False
-        except ValueError:
-            return False
+        return False
 
     def _go_live(self) -> None:
         runner, playing = self._current_playback_source()
@@ -4167,13 +4791,13 @@ class App(tk.Tk):
             if self._selected_a < 0 and self._selected_b < 0:
                 if self._cues_a:
                     self._selected_a = 0
-                    self.tree_a.selection_set("0")
-                    self.tree_a.see("0")
+                    self.tree_a.selection_set(self._cues_a[0].id)
+                    self.tree_a.see(self._cues_a[0].id)
                     self._load_cue_into_editor(self._cues_a[0])
                 elif self._cues_b:
                     self._selected_b = 0
-                    self.tree_b.selection_set("0")
-                    self.tree_b.see("0")
+                    self.tree_b.selection_set(self._cues_b[0].id)
+                    self.tree_b.see(self._cues_b[0].id)
                     self._load_cue_into_editor(self._cues_b[0])
         self._play_selected()
 
@@ -4196,9 +4820,7 @@ class App(tk.Tk):
 
         if self._paused_cue_id and self._paused_pos_sec is not None:
             # Search for paused cue in both decks
-            cue_obj = next((c for c in self._cues_a if c.id == self._paused_cue_id), None)
-            if cue_obj is None:
-                cue_obj = next((c for c in self._cues_b if c.id == self._paused_cue_id), None)
+            cue_obj = self._cue_by_id(self._paused_cue_id)
             if cue_obj is None:
                 return
             new_pos = max(0.0, float(self._paused_pos_sec) + delta)
@@ -4217,9 +4839,7 @@ class App(tk.Tk):
                 t = None
             if t is not None:
                 # Search for playing cue in both decks
-                cue_obj = next((c for c in self._cues_a if c.id == playing.id), None)
-                if cue_obj is None:
-                    cue_obj = next((c for c in self._cues_b if c.id == playing.id), None)
+                cue_obj = self._cue_by_id(playing.id)
                 if cue_obj is None:
                     cue_obj = self._selected_cue()
                 # No need to update tree selection - just use the cue object
@@ -4267,15 +4887,48 @@ class App(tk.Tk):
             pass
         self._log(f"Marked STOP: {cue.display_name()} @ {_format_timecode(cue.stop_at_sec)}")
 
-    def _poll_playback(self) -> None:
-        delay_ms = 250
+    def _mark_dirty(self, *names: str) -> None:
+        for name in names or tuple(self._dirty):
+            self._dirty[name] = True
+
+    def _schedule_ui_flush(self) -> None:
+        # Producers outside the poll tick mark their area dirty and share one idle redraw.
+        if self._ui_flush_after_id is not None:
+            return
         try:
-            self._drain_ui_tasks()
+            self._ui_flush_after_id = self.after_idle(self._flush_ui)
+        except Exception:
+            self._ui_flush_after_id = None
+
+    def _flush_ui(self, a_playing: bool | None = None, b_playing: bool | None = None) -> None:
+        if self._ui_flush_after_id is not None:
+            try:
+                self.after_cancel(self._ui_flush_after_id)
+            except Exception:
+                pass
+            self._ui_flush_after_id = None
+        dirty = self._dirty
+        if dirty["now_playing"]:
+            dirty["now_playing"] = False
             self._update_now_playing()
+        if dirty["vu"]:
+            dirty["vu"] = False
             self._update_vu_meters()
+        if dirty["waveform"]:
+            dirty["waveform"] = False
             self._update_waveform_playback_visuals()
-            self._update_transport_button_visuals()
-            self._update_tree_playing_highlight()
+        if dirty["transport"]:
+            dirty["transport"] = False
+            self._update_transport_button_visuals(a_playing, b_playing)
+        if dirty["tree_hl"]:
+            dirty["tree_hl"] = False
+            self._update_tree_playing_highlight(a_playing, b_playing)
+
+    def _poll_playback(self) -> None:
+        t0 = time.monotonic()
+        target_ms = 250.0
+        try:
+            self._drain_ui_tasks()
             try:
                 a_playing = bool(self.audio_runner.is_playing())
             except Exception:
@@ -4284,6 +4937,33 @@ class App(tk.Tk):
                 b_playing = bool(self.video_runner.is_playing())
             except Exception:
                 b_playing = False
+            cue_a = self.audio_runner.current_cue() if a_playing else None
+            cue_b = self.video_runner.current_cue() if b_playing else None
+
+            # Any transport/selection change invalidates everything; otherwise only the
+            # time-driven visuals (VU, cursor, clock/blink) need redrawing while a deck is active.
+            sig = (
+                a_playing,
+                b_playing,
+                cue_a.id if cue_a is not None else None,
+                cue_b.id if cue_b is not None else None,
+                self._paused_a,
+                self._paused_b,
+                self._paused_cue_id,
+                self._selected_a,
+                self._selected_b,
+                len(self._cues_a),
+                len(self._cues_b),
+                self._loop_a_enabled,
+                self._loop_b_enabled,
+            )
+            if sig != self._poll_state_sig:
+                self._poll_state_sig = sig
+                self._mark_dirty()
+            if a_playing or b_playing or self._paused_a is not None or self._paused_b is not None:
+                self._mark_dirty("now_playing", "vu", "waveform")
+
+            self._flush_ui(a_playing, b_playing)
 
             if self._was_playing_a and not a_playing:
                 self._handle_runner_finished("A", self.audio_runner)
@@ -4293,89 +4973,113 @@ class App(tk.Tk):
             self._was_playing_a = a_playing
             self._was_playing_b = b_playing
             if a_playing or b_playing:
-                delay_ms = 33
+                target_ms = 16.0
+                self._poll_active_until = t0 + 0.5
             elif self._paused_a is not None or self._paused_b is not None:
-                delay_ms = 80
+                target_ms = 80.0
+            elif t0 < self._poll_active_until:
+                # Hysteresis: stay responsive briefly after a stop so auto-advance/restarts
+                # do not bounce between the 16 ms and 250 ms rates.
+                target_ms = 33.0
+            # Minimized: keep end-of-cue handling going but stop redrawing at full rate.
+            if self.state() == "iconic":
+                target_ms = max(target_ms, 500.0)
         finally:
-            self.after(int(delay_ms), self._poll_playback)
+            # Schedule relative to when this tick started, so slow ticks do not stretch the period.
+            elapsed_ms = (time.monotonic() - t0) * 1000.0
+            self.after(max(8, int(target_ms - elapsed_ms)), self._poll_playback)
 
-    def _drain_ui_tasks(self, max_items: int = 10) -> None:
+    def _drain_ui_tasks(self, max_items: int = 32) -> None:
+        self._ui_drain_after_id = None
         for _ in range(int(max_items)):
             try:
                 fn = self._ui_tasks.get_nowait()
             except Exception:
-                return
+                break
             try:
                 fn()
             except Exception:
                 continue
+        else:
+            # More results arrived than one batch; keep draining on the next idle tick
+            # instead of waiting for the poll timer.
+            if self._ui_drain_after_id is None:
+                try:
+                    self._ui_drain_after_id = self.after_idle(self._drain_ui_tasks)
+                except Exception:
+                    self._ui_drain_after_id = None
+        if self._analysis_progress_dirty:
+            self._flush_analysis_progress()
 
-    def _update_tree_playing_highlight(self) -> None:
-        # Highlight the currently playing cue in each deck's file list without changing selection.
-        if self._playing_iid_a is None and self._playing_iid_b is None:
+    def _flush_analysis_progress(self) -> None:
+        self._analysis_progress_dirty = False
+        try:
+            total = int(self._analysis_batch_total)
+            done = int(self._analysis_batch_done)
+            if (done, total) == self._last_progress_set:
+                return
+            self._last_progress_set = (done, total)
+            self._analysis_progress_var.set(float(done))
+            self._analysis_progress_text_var.set(f"{done}/{total}" if total > 0 else "0/0")
             try:
-                if not (self.audio_runner.is_playing() or self.video_runner.is_playing()):
-                    return
+                if self._analysis_progressbar is not None and self._analysis_progressbar.winfo_exists():
+                    self._analysis_progressbar.configure(maximum=max(1, total))
             except Exception:
                 pass
-        new_iid_a: str | None = None
-        new_iid_b: str | None = None
-        try:
-            if self.audio_runner.is_playing():
-                cue = self.audio_runner.current_cue()
-                if cue is not None:
-                    iid = self._cueid_to_iid_a.get(cue.id)
-                    if iid is not None and self.tree_a.exists(iid):
-                        new_iid_a = iid
-        except Exception:
-            pass
-        try:
-            if self.video_runner.is_playing():
-                cue = self.video_runner.current_cue()
-                if cue is not None:
-                    iid = self._cueid_to_iid_b.get(cue.id)
-                    if iid is not None and self.tree_b.exists(iid):
-                        new_iid_b = iid
+            if total > 0 and done >= total:
+                self._analysis_progress_text_var.set("Done")
         except Exception:
             pass
 
+    def _update_tree_playing_highlight(self, a_playing: bool | None = None, b_playing: bool | None = None) -> None:
+        # Highlight the currently playing cue in each deck's file list without changing selection.
+        # _poll_playback passes the playing flags it already has; other callers let us query.
+        if a_playing is None:
+            a_playing = self.audio_runner.is_playing()
+        if b_playing is None:
+            b_playing = self.video_runner.is_playing()
+        if self._playing_iid_a is None and self._playing_iid_b is None and not (a_playing or b_playing):
+            return
+        new_iid_a: str | None = None
+        new_iid_b: str | None = None
+        if a_playing:
+            cue = self.audio_runner.current_cue()
+            if cue is not None:
+                iid = cue.id if cue.id in self._cue_index_a else None
+                if iid is not None and _tk_safe(self.tree_a.exists, iid):
+                    new_iid_a = iid
+        if b_playing:
+            cue = self.video_runner.current_cue()
+            if cue is not None:
+                iid = cue.id if cue.id in self._cue_index_b else None
+                if iid is not None and _tk_safe(self.tree_b.exists, iid):
+                    new_iid_b = iid
+
         if new_iid_a == self._playing_iid_a and new_iid_b == self._playing_iid_b:
             return
 
         if new_iid_a != self._playing_iid_a:
-            try:
-                if self._playing_iid_a is not None and self.tree_a.exists(self._playing_iid_a):
-                    tags = [t for t in (self.tree_a.item(self._playing_iid_a).get("tags") or ()) if t != "playing"]
-                    self.tree_a.item(self._playing_iid_a, tags=tuple(tags))
-            except Exception:
-                pass
-            try:
-                if new_iid_a is not None and self.tree_a.exists(new_iid_a):
-                    tags = list(self.tree_a.item(new_iid_a).get("tags") or ())
-                    if "playing" not in tags:
-                        tags.append("playing")
-                    self.tree_a.item(new_iid_a, tags=tuple(tags))
-            except Exception:
-                pass
+            self._set_row_playing(self.tree_a, self._playing_iid_a, False)
+            self._set_row_playing(self.tree_a, new_iid_a, True)
             self._playing_iid_a = new_iid_a
 
         if new_iid_b != self._playing_iid_b:
-            try:
-                if self._playing_iid_b is not None and self.tree_b.exists(self._playing_iid_b):
-                    tags = [t for t in (self.tree_b.item(self._playing_iid_b).get("tags") or ()) if t != "playing"]
-                    self.tree_b.item(self._playing_iid_b, tags=tuple(tags))
-            except Exception:
-                pass
-            try:
-                if new_iid_b is not None and self.tree_b.exists(new_iid_b):
-                    tags = list(self.tree_b.item(new_iid_b).get("tags") or ())
-                    if "playing" not in tags:
-                        tags.append("playing")
-                    self.tree_b.item(new_iid_b, tags=tuple(tags))
-            except Exception:
-                pass
+            self._set_row_playing(self.tree_b, self._playing_iid_b, False)
+            self._set_row_playing(self.tree_b, new_iid_b, True)
             self._playing_iid_b = new_iid_b
 
+    def _set_row_playing(self, tree: ttk.Treeview, iid: str | None, playing: bool) -> None:
+        # One Tcl call to read just the tags, and a write only if the "playing" tag actually flips.
+        if iid is None:
+            return
+        tags = _tk_safe(tree.item, iid, "tags") or ()
+        if isinstance(tags, str):
+            tags = tuple(tags.split())
+        if ("playing" in tags) == playing:
+            return
+        rest = tuple(t for t in tags if t != "playing")
+        _tk_safe(tree.item, iid, tags=rest + ("playing",) if playing else rest)
+
     def _handle_runner_finished(self, deck: str, runner: MediaRunner) -> None:
         # Do not advance on user stop/pause, only on natural OUT/file end.
         if deck in self._suppress_finish:
@@ -4418,26 +5122,15 @@ class App(tk.Tk):
             pass
         self._select_next_cue_for_deck(deck)
 
-    def _update_transport_button_visuals(self) -> None:
+    def _update_transport_button_visuals(self, a_playing: bool | None = None, b_playing: bool | None = None) -> None:
         def _update_deck(deck: str, *, playing: bool, loop_enabled: bool) -> None:
             try:
-                if deck == "A":
-                    btn_play = getattr(self, "btn_play_a", None)
-                    btn_stop = getattr(self, "btn_stop_a", None)
-                    btn_loop = getattr(self, "btn_loop_a", None)
-                    var_play = getattr(self, "var_play_a", None)
-                else:
-                    btn_play = getattr(self, "btn_play_b", None)
-                    btn_stop = getattr(self, "btn_stop_b", None)
-                    btn_loop = getattr(self, "btn_loop_b", None)
-                    var_play = getattr(self, "var_play_b", None)
-
-                paused = self._paused_state_for_deck(deck)
-                sel = self._selected_cue_for_deck(deck)
+                w = self._deck_widgets[deck]
+                btn_play, btn_stop, btn_loop, var_play = w["play"], w["stop"], w["loop"], w["var_play"]
 
                 if playing:
                     play_text = "⏸ PAUSE"
-                elif paused is not None and sel is not None and paused[0] == sel.id:
+                elif self._is_selected_cue_paused(deck):
                     play_text = "▶ RESUME"
                 else:
                     play_text = "▶ PLAY"
@@ -4452,41 +5145,29 @@ class App(tk.Tk):
                     return
                 self._transport_visual_cache[deck] = state
 
-                if var_play is not None:
-                    try:
-                        if str(var_play.get()) != play_text:
-                            var_play.set(play_text)
-                    except Exception:
-                        pass
-
+                if var_play is not None and _tk_safe(var_play.get) != play_text:
+                    _tk_safe(var_play.set, play_text)
                 if btn_play is not None:
-                    try:
-                        btn_play.configure(bg=play_bg, fg=self._btn_off_fg)
-                    except Exception:
-                        pass
+                    _tk_safe(btn_play.configure, bg=play_bg, fg=self._btn_off_fg)
                 if btn_stop is not None:
-                    try:
-                        btn_stop.configure(bg=stop_bg, fg=self._btn_off_fg)
-                    except Exception:
-                        pass
+                    _tk_safe(btn_stop.configure, bg=stop_bg, fg=self._btn_off_fg)
                 if btn_loop is not None:
-                    try:
-                        btn_loop.configure(bg=loop_bg, fg=loop_fg)
-                    except Exception:
-                        pass
+                    _tk_safe(btn_loop.configure, bg=loop_bg, fg=loop_fg)
             except Exception:
                 return
 
-        try:
-            a_playing = bool(self.audio_runner.is_playing())
-        except Exception:
-            a_playing = False
+        if a_playing is None:
+            try:
+                a_playing = bool(self.audio_runner.is_playing())
+            except Exception:
+                a_playing = False
         _update_deck("A", playing=a_playing, loop_enabled=bool(self._loop_a_enabled))
 
-        try:
-            b_playing = bool(self.video_runner.is_playing())
-        except Exception:
-            b_playing = False
+        if b_playing is None:
+            try:
+                b_playing = bool(self.video_runner.is_playing())
+            except Exception:
+                b_playing = False
         _update_deck("B", playing=b_playing, loop_enabled=bool(self._loop_b_enabled))
 
     def _current_playback_source(self) -> tuple[object | None, Cue | None]:
@@ -4503,63 +5184,92 @@ class App(tk.Tk):
         return None, None
 
     def _update_now_playing(self) -> None:
+        _slow, blink_fast = _blink_phases()
         # Update Deck A
         self._update_deck_now_playing(
             "A",
             self.audio_runner,
-            self.var_now_a_time
+            self.var_now_a_time,
+            blink_fast,
         )
 
         # Update Deck B
         self._update_deck_now_playing(
             "B",
             self.video_runner,
-            self.var_now_b_time
+            self.var_now_b_time,
+            blink_fast,
         )
 
     def _ensure_vu_items(self, deck: str, canvas: tk.Canvas) -> dict[str, int]:
         items = self._vu_items.get(deck)
         if items:
             try:
-                canvas.type(items["peak"])
-                return items
+                if canvas.type(items["peak"]):
+                    return items
             except Exception:
                 pass
 
-        bg = canvas.create_rectangle(0, 0, 0, 0, fill="#1f1f1f", outline="#3b3b3b", width=1, tags=("vu_bg",))
+        # Created hidden so the canvas matches _vu_visible[deck] = False below.
+        bg = canvas.create_rectangle(0, 0, 0, 0, fill="#1f1f1f", outline="#3b3b3b", width=1, state="hidden", tags=("vu_bg",))
         # LED-style segments.
         seg_ids: list[int] = []
         for _ in range(24):
-            seg_ids.append(canvas.create_rectangle(0, 0, 0, 0, fill="#2a2a2a", outline="", tags=("vu_seg",)))
+            seg_ids.append(canvas.create_rectangle(0, 0, 0, 0, fill="#2a2a2a", outline="", state="hidden", tags=("vu_seg",)))
         # Peak marker as a thin in-bar rectangle (keeps within bar height).
-        peak = canvas.create_rectangle(0, 0, 0, 0, fill="#eaeaea", outline="", tags=("vu_peak",))
+        peak = canvas.create_rectangle(0, 0, 0, 0, fill="#eaeaea", outline="", state="hidden", tags=("vu_peak",))
+        # Stacking is fixed at creation (bg < segments < peak); no per-frame raises needed.
+        try:
+            canvas.tag_raise("vu_bg")
+            canvas.tag_raise("vu_seg")
+            canvas.tag_raise("vu_peak")
+        except Exception:
+            pass
         items = {"bg": bg, "peak": peak, **{f"s{i}": sid for i, sid in enumerate(seg_ids)}}
         self._vu_items[deck] = items
         self._vu_visible[deck] = False
+        self._vu_seg_cache[deck] = {}
+        self._vu_seg_ids[deck] = seg_ids
         return items
 
     def _set_vu_visible(self, deck: str, canvas: tk.Canvas, visible: bool) -> None:
         if bool(self._vu_visible.get(deck, False)) == bool(visible):
             return
+        self._ensure_vu_items(deck, canvas)
         self._vu_visible[deck] = bool(visible)
-        items = self._ensure_vu_items(deck, canvas)
         state = "normal" if visible else "hidden"
-        for iid in items.values():
+        # Tag-wide configure: 3 Tcl calls instead of one per segment.
+        for tag in ("vu_bg", "vu_seg", "vu_peak"):
             try:
-                canvas.itemconfigure(iid, state=state)
+                canvas.itemconfigure(tag, state=state)
             except Exception:
                 pass
 
+    def _is_viewable(self, key: str, widget) -> bool:
+        # winfo_viewable() is a Tcl round-trip; re-check at most every 500 ms.
+        now = time.monotonic()
+        cached = self._viewable_cache.get(key)
+        if cached is not None and now - cached[0] < 0.5:
+            return cached[1]
+        try:
+            viewable = bool(widget.winfo_viewable())
+        except Exception:
+            viewable = False
+        self._viewable_cache[key] = (now, viewable)
+        return viewable
+
     def _clear_vu_for_deck(self, deck: str) -> None:
-        canvas = getattr(self, "vu_canvas_a", None) if deck == "A" else getattr(self, "vu_canvas_b", None)
+        w = self._deck_widgets[deck]
+        canvas = w["vu_canvas"]
         if canvas is None:
             return
+        self._vu_last_frame[deck] = None
         try:
             self._set_vu_visible(deck, canvas, False)
         except Exception:
             return
         try:
-            var = getattr(self, "var_vu_a_db", None) if deck == "A" else getattr(self, "var_vu_b_db", None)
+            var = w["var_vu_db"]
             if var is not None:
                 var.set("")
             self._vu_db_cache[deck] = ""
@@ -4567,26 +5277,93 @@ class App(tk.Tk):
             pass
 
     def _find_cue_by_id_for_deck(self, deck: str, cue_id: str) -> Cue | None:
-        try:
-            cues = self._cues_a if deck == "A" else self._cues_b
-        except Exception:
-            return None
-        try:
-            for c in cues:
-                if c.id == cue_id:
-                    return c
-        except Exception:
-            return None
-        return None
+        index = self._cue_by_id_a if deck == "A" else self._cue_by_id_b
+        return index.get(cue_id)
+
+    def _cue_by_id(self, cue_id: str) -> Cue | None:
+        cue = self._cue_by_id_a.get(cue_id)
+        if cue is None:
+            cue = self._cue_by_id_b.get(cue_id)
+        return cue
 
     def _update_vu_meters(self) -> None:
         self._update_vu_for_deck("A", self.audio_runner)
         self._update_vu_for_deck("B", self.video_runner)
 
+    def _canvas_size(self, key: str, canvas: tk.Canvas) -> tuple[int, int]:
+        dims = self._canvas_dims.get(key)
+        if dims is None:
+            try:
+                dims = (int(canvas.winfo_width() or 0), int(canvas.winfo_height() or 0))
+            except Exception:
+                dims = (0, 0)
+            # Only remember real sizes; before the first <Configure> Tk reports 1x1.
+            if dims[0] > 1 and dims[1] > 1:
+                self._canvas_dims[key] = dims
+        return dims
+
+    def _normalize_snapshot(self) -> tuple[bool, float, float | None]:
+        # (enabled, true-peak ceiling dB, target LUFS) read once per settings change, not per VU frame.
+        snap = self._norm_snapshot
+        if snap is None:
+            s = self.settings
+            try:
+                target_i: float | None = float(getattr(s, "normalize_target_i_lufs", -14.0))
+            except Exception:
+                target_i = None
+            snap = (
+                bool(getattr(s, "normalize_enabled", False)),
+                _clamp_float(getattr(s, "normalize_true_peak_db", -1.0), -9.0, 0.0, -1.0),
+                target_i,
+            )
+            self._norm_snapshot = snap
+        return snap
+
+    def _on_settings_changed(self) -> None:
+        self._norm_snapshot = None
+
+    def _vu_db_lut(self, cue_id: str, levels: list[float], peak_raw: float) -> list[float]:
+        # Relative meter based on the cue's own peak envelope, precomputed once per profile:
+        # lut[i] = 20*log10(levels[i] / peak_raw), clamped to [-80, 0] dB.
+        cached = self._vu_db_lut_cache.get(cue_id)
+        if cached is not None and cached[0] is levels:
+            return cached[1]
+        peak = float(max(1e-6, peak_raw))
+        lut: list[float] = []
+        for v in levels:
+            try:
+                rel = max(1e-6, min(1.0, float(v) / peak))
+                lut.append(max(-80.0, min(0.0, 20.0 * math.log10(rel))))
+            except Exception:
+                lut.append(-80.0)
+        self._vu_db_lut_cache[cue_id] = (levels, lut)
+        return lut
+
+    def _vu_gradient(self, seg_total: int, red_zone_start: int) -> tuple[str, ...]:
+        # Lit LED colors (blue -> red), fixed for a given segment count and red-zone start.
+        key = (int(seg_total), int(red_zone_start))
+        grad = self._vu_gradient_cache.get(key)
+        if grad is not None:
+            return grad
+        blue = (0x4A, 0x9E, 0xFF)  # matches waveform blue
+        red = (0xFF, 0x17, 0x44)
+        colors: list[str] = []
+        for i in range(key[0]):
+            t = 0.0 if seg_total <= 1 else float(i) / float(seg_total - 1)
+            if i >= red_zone_start:
+                # Force a stronger red in the last zone.
+                t = max(t, 0.85)
+            colors.append(_mix_rgb(blue, red, t))
+        grad = tuple(colors)
+        self._vu_gradient_cache[key] = grad
+        return grad
+
     def _update_vu_for_deck(self, deck: str, runner: MediaRunner) -> None:
-        canvas = getattr(self, "vu_canvas_a", None) if deck == "A" else getattr(self, "vu_canvas_b", None)
+        canvas = self._deck_widgets[deck]["vu_canvas"]
         if canvas is None:
             return
+        if not self._is_viewable(deck, canvas):
+            return
 
         cue: Cue | None = None
         pos: float | None = None
@@ -4629,26 +5406,19 @@ class App(tk.Tk):
         except Exception:
             peak_raw = 0.0
         if peak_raw <= 1e-6:
-            try:
-                peak_raw = max(float(v) for v in levels) if levels else 0.0
-            except Exception:
-                peak_raw = 0.0
-            try:
-                self._vu_profile_cache[cue.id] = (int(len(levels)), float(peak_raw), list(levels))
-            except Exception:
-                pass
+            peak_raw = self._set_vu_profile(cue.id, levels)
+        db_lut = self._vu_db_lut(cue.id, levels, peak_raw)
         idx = int(max(0.0, min(1.0, float(pos) / float(duration))) * (len(levels) - 1))
         # Sample a tiny window for a livelier "VU" feel.
         a = max(0, idx - 1)
         b = min(len(levels), idx + 2)
-        raw = max([float(v) for v in levels[a:b]] + [0.0])
+        db_rel = max(db_lut[a:b], default=-80.0)
 
         # Approximate POST-fader behavior by applying the same gain logic used for playback normalization.
         gain_db = 0.0
-        tp_limit_db = _clamp_float(getattr(self.settings, "normalize_true_peak_db", -1.0), -9.0, 0.0, -1.0)
+        normalize_on, tp_limit_db, target_i = self._normalize_snapshot()
         try:
-            if bool(getattr(self.settings, "normalize_enabled", False)) and cue.loudness_i_lufs is not None:
-                target_i = float(getattr(self.settings, "normalize_target_i_lufs", -14.0))
+            if normalize_on and target_i is not None and cue.loudness_i_lufs is not None:
                 gain_db = float(target_i) - float(cue.loudness_i_lufs)
                 if cue.true_peak_db is not None:
                     gain_db = min(gain_db, float(tp_limit_db) - float(cue.true_peak_db))
@@ -4656,165 +5426,112 @@ class App(tk.Tk):
         except Exception:
             gain_db = 0.0
 
-        # Use a relative meter based on the cue's own peak envelope, then apply gain/TP for a post-fader feel.
-        rel = float(raw) / float(max(1e-6, peak_raw))
-        rel = max(0.0, min(1.0, rel))
-        try:
-            db_rel = 20.0 * math.log10(max(1e-6, rel))  # <= 0.0
-        except Exception:
-            db_rel = -80.0
-        db_rel = max(-80.0, min(0.0, db_rel))
-
-        normalize_on = bool(getattr(self.settings, "normalize_enabled", False))
         top_db = float(tp_limit_db) if normalize_on else 0.0
         # Apply gain to the relative dB, then cap to top (represents limiter/ceiling).
-        dbfs = min(float(top_db), float(top_db) + float(db_rel) + float(gain_db))
-        dbfs = max(-80.0, min(float(top_db), dbfs))
+        dbfs = min(top_db, top_db + db_rel + gain_db)
+        dbfs = max(-80.0, min(top_db, dbfs))
 
         # DJ-style scale: focus on the visible range.
         min_db = -24.0
-        max_db = float(top_db)
+        max_db = top_db
         if max_db <= min_db:
             max_db = -1.0
-        target = (float(dbfs) - float(min_db)) / (float(max_db) - float(min_db))
-        target = max(0.0, min(1.0, float(target)))
-
-        st = self._vu_state.get(deck)
-        if st is None:
-            st = {"level": 0.0, "peak": 0.0, "last_t": float(time.monotonic()), "peak_hold_until": 0.0}
-            self._vu_state[deck] = st
-
-        now = float(time.monotonic())
-        dt = max(0.0, min(0.25, now - float(st.get("last_t", now))))
-        st["last_t"] = now
-
-        # Attack/decay smoothing.
-        cur = float(st.get("level", 0.0))
-        if target >= cur:
-            cur = cur + (target - cur) * min(1.0, 18.0 * dt)
-        else:
-            cur = max(target, cur - (2.2 * dt))
-        cur = max(0.0, min(1.0, cur))
-        st["level"] = cur
-
-        # Peak hold.
-        peak = float(st.get("peak", 0.0))
-        hold_until = float(st.get("peak_hold_until", 0.0))
-        if cur >= peak:
-            peak = cur
-            hold_until = now + 0.8
-        elif now > hold_until:
-            peak = max(cur, peak - (1.6 * dt))
-        peak = max(0.0, min(1.0, peak))
-        st["peak"] = peak
-        st["peak_hold_until"] = hold_until
+        target = (dbfs - min_db) / (max_db - min_db)
+        target = max(0.0, min(1.0, target))
+        # Snap to a 1/64 grid (finer than the 24 LEDs) so steady audio settles and repeats frames exactly.
+        target = round(target * 64.0) * (1.0 / 64.0)
 
-        try:
-            w = int(canvas.winfo_width() or 0)
-            h = int(canvas.winfo_height() or 0)
-        except Exception:
-            w, h = 0, 0
+        now = time.monotonic()
+        st = self._vu_state_a if deck == "A" else self._vu_state_b
+        dt = max(0.0, min(0.25, now - st.last_t))
+        st.last_t = now
+
+        w, h = self._canvas_size(f"vu_{deck}", canvas)
         if w < 20 or h < 8:
             w, h = 120, 10
 
         items = self._ensure_vu_items(deck, canvas)
         self._set_vu_visible(deck, canvas, True)
 
-        # Thin LED-style bar area.
-        bar_h = max(6, min(10, h))
-        y0 = int((h - bar_h) / 2)
-        y1 = y0 + bar_h
-        canvas.coords(items["bg"], 0, y0, w, y1)
-
-        inner_y0 = y0 + 1
-        inner_y1 = y1 - 1
-
         # LED segments (blue -> red gradient, with a red-zone tail).
-        seg_total = 24
-        seg_ids = [items.get(f"s{i}") for i in range(seg_total)]
-        seg_ids = [sid for sid in seg_ids if isinstance(sid, int)]
-        if seg_ids:
-            seg_total = len(seg_ids)
+        seg_ids = self._vu_seg_ids.get(deck) or []
+        bg_box, seg_boxes = _vu_layout(w, h, len(seg_ids) or 24)
+        seg_total = len(seg_boxes)
+        seg_ids = seg_ids[:seg_total]
+
+        seg_cache = self._vu_seg_cache.setdefault(deck, {})
+        if seg_cache.get(items["bg"]) != bg_box:
+            canvas.coords(items["bg"], *bg_box)
+            seg_cache[items["bg"]] = bg_box
+        inner_y0 = bg_box[1] + 1
+        inner_y1 = bg_box[3] - 1
+
+        cur, peak, hold_until, lit, red_zone_start = _vu_step(
+            target,
+            st.level,
+            st.peak,
+            st.peak_hold_until,
+            now,
+            dt,
+            seg_total,
+            min_db,
+            max_db,
+        )
+        st.level = cur
+        st.peak = peak
+        st.peak_hold_until = hold_until
+
+        px = max(1, min(w - 1, 1 + int((w - 2) * peak)))
+        db_txt = f"{dbfs:>5.1f} dB"
+        # Nothing visible moved (same lit LEDs, peak pixel and readout): skip the redraw.
+        frame = (items["bg"], w, h, seg_total, lit, red_zone_start, px, db_txt)
+        if self._vu_last_frame.get(deck) == frame:
+            return
+        self._vu_last_frame[deck] = frame
 
-        gap = 1
-        usable_w = max(1, (w - 2) - (seg_total - 1) * gap)
-        seg_w = max(1, int(usable_w / seg_total))
-        # If too cramped, reduce the number of visible segments.
-        while seg_total > 12 and seg_w <= 2:
-            seg_total -= 4
-            seg_ids = seg_ids[:seg_total]
-            usable_w = max(1, (w - 2) - (seg_total - 1) * gap)
-            seg_w = max(1, int(usable_w / seg_total))
-
-        lit = int(round(max(0.0, min(1.0, cur)) * seg_total))
-        # Red zone: last ~6 dB (relative to the top of scale).
-        red_db = float(max_db) - 6.0
-        red_zone_norm = (red_db - float(min_db)) / (float(max_db) - float(min_db))
-        red_zone_start = max(0, min(seg_total - 1, int(seg_total * max(0.0, min(1.0, red_zone_norm)))))
         base_off = "#2a2a2a"
-        blue = (0x4A, 0x9E, 0xFF)  # matches waveform blue
-        red = (0xFF, 0x17, 0x44)
-
-        def _mix(c1, c2, t: float) -> str:
-            t = max(0.0, min(1.0, float(t)))
-            r = int(c1[0] + (c2[0] - c1[0]) * t)
-            g = int(c1[1] + (c2[1] - c1[1]) * t)
-            b = int(c1[2] + (c2[2] - c1[2]) * t)
-            return f"#{r:02x}{g:02x}{b:02x}"
+        grad = self._vu_gradient(seg_total, red_zone_start)
 
         for i, sid in enumerate(seg_ids):
-            x0 = 1 + i * (seg_w + gap)
-            x1 = min(w - 1, x0 + seg_w)
-            canvas.coords(sid, x0, inner_y0, x1, inner_y1)
-            if i < lit:
-                t = 0.0 if seg_total <= 1 else float(i) / float(seg_total - 1)
-                if i >= red_zone_start:
-                    # Force a stronger red in the last zone.
-                    t = max(t, 0.85)
-                canvas.itemconfigure(sid, fill=_mix(blue, red, t), state="normal")
-            else:
-                canvas.itemconfigure(sid, fill=base_off, state="normal")
+            box = seg_boxes[i]
+            fill = grad[i] if i < lit else base_off
+            prev = seg_cache.get(sid)
+            if prev is None or prev[0] != box:
+                canvas.coords(sid, *box)
+            if prev is None or prev[1] != fill:
+                canvas.itemconfigure(sid, fill=fill)
+            seg_cache[sid] = (box, fill)
 
         # Peak marker
-        px = max(1, min(w - 1, 1 + int((w - 2) * float(peak))))
         px0 = max(1, px - 1)
         px1 = min(w - 1, px + 1)
-        canvas.coords(items["peak"], px0, inner_y0, px1, inner_y1)
-        canvas.itemconfigure(items["peak"], state="normal")
+        peak_box = (px0, inner_y0, px1, inner_y1)
+        if seg_cache.get(items["peak"]) != peak_box:
+            canvas.coords(items["peak"], *peak_box)
+            seg_cache[items["peak"]] = peak_box
 
         # dB readout (approx.; derived from precomputed envelope + normalization gain/ceiling)
-        db_txt = f"{float(dbfs):>5.1f} dB"
         if self._vu_db_cache.get(deck) != db_txt:
             self._vu_db_cache[deck] = db_txt
             try:
-                var = getattr(self, "var_vu_a_db", None) if deck == "A" else getattr(self, "var_vu_b_db", None)
+                var = self._deck_widgets[deck]["var_vu_db"]
                 if var is not None:
                     var.set(db_txt)
             except Exception:
                 pass
 
-        try:
-            canvas.tag_raise("vu_peak")
-        except Exception:
-            pass
-        try:
-            canvas.tag_raise("vu_bg")
-            canvas.tag_raise("vu_seg")
-            canvas.tag_raise("vu_peak")
-        except Exception:
-            pass
-
     def _update_waveform_playback_visuals(self) -> None:
-        self._update_waveform_playback_for_deck("A", self.audio_runner)
-        self._update_waveform_playback_for_deck("B", self.video_runner)
+        blink_slow, blink_fast = _blink_phases()
+        self._update_waveform_playback_for_deck("A", self.audio_runner, blink_slow, blink_fast)
+        self._update_waveform_playback_for_deck("B", self.video_runner, blink_slow, blink_fast)
 
     def _ensure_playback_items(self, deck: str, canvas: tk.Canvas) -> dict[str, int]:
         items = self._playback_items.get(deck)
         if items:
             try:
-                # Validate at least one item still exists.
-                canvas.type(items["cursor"])
-                return items
+                # Validate at least one item still exists (canvas.delete("all") on deselect/remove).
+                if canvas.type(items["cursor"]):
+                    return items
             except Exception:
                 pass
 
@@ -4823,6 +5540,11 @@ class App(tk.Tk):
         remain = canvas.create_rectangle(0, 0, 0, 0, fill="#ffab00", outline="", tags=("playback_bg",))
         cursor = canvas.create_line(0, 0, 0, 0, fill="#ffffff", width=2, tags=("playback_fg",))
         out_line = canvas.create_line(0, 0, 0, 0, fill="#ff1744", width=3, tags=("playback_fg",))
+        # New items stack above the waveform image (bg < fg); keep the IN/OUT markers on top.
+        try:
+            canvas.tag_raise("marker")
+        except Exception:
+            pass
         items = {"seg_bg": seg_bg, "played": played, "remain": remain, "cursor": cursor, "out": out_line}
         self._playback_items[deck] = items
         self._playback_visible[deck] = False
@@ -4851,7 +5573,15 @@ class App(tk.Tk):
         except Exception:
             return
 
-    def _update_waveform_playback_for_deck(self, deck: str, runner: MediaRunner) -> None:
+    def _update_waveform_playback_for_deck(
+        self,
+        deck: str,
+        runner: MediaRunner,
+        blink_slow: bool | None = None,
+        blink_fast: bool | None = None,
+    ) -> None:
+        if blink_slow is None or blink_fast is None:
+            blink_slow, blink_fast = _blink_phases()
         try:
             if deck == "A":
                 if self._selected_a < 0 or self._selected_a >= len(self._cues_a):
@@ -4891,20 +5621,11 @@ class App(tk.Tk):
                 seg_end = float(selected.stop_at_sec) if selected.stop_at_sec is not None else float(duration)
                 seg_end = max(seg_start, min(float(duration), seg_end))
 
-                width = max(1, int(canvas.winfo_width() or 1))
-                height = max(1, int(canvas.winfo_height() or 1))
+                width, height = self._canvas_size(f"wave_{deck}", canvas)
                 if width < 10 or height < 10:
                     width, height = 600, 60
 
-                x0 = int((seg_start / float(duration)) * width)
-                x1 = int((seg_end / float(duration)) * width)
-                x0 = max(0, min(width, x0))
-                x1 = max(0, min(width, x1))
-                if x1 < x0:
-                    x0, x1 = x1, x0
-
-                px = int((pos / float(duration)) * width)
-                px = max(0, min(width, px))
+                x0, x1, px = _playback_geometry(seg_start, seg_end, pos, duration, width)
 
                 items = self._ensure_playback_items(deck, canvas)
                 self._set_playback_visibility(deck, canvas, visible=True)
@@ -4926,17 +5647,11 @@ class App(tk.Tk):
                     canvas.itemconfigure(items["remain"], state="hidden")
 
                 # Paused cursor (blink).
-                blink_on = (int(time.monotonic() * 3) % 2 == 0)
+                blink_on = blink_slow
                 cursor_color = "#ffab00" if blink_on else "#ffffff"
                 canvas.coords(items["cursor"], px, 0, px, height)
                 canvas.itemconfigure(items["cursor"], fill=cursor_color, state="normal")
                 canvas.itemconfigure(items["out"], state="hidden")
-                try:
-                    canvas.tag_raise("playback_bg")
-                    canvas.tag_raise("playback_fg")
-                    canvas.tag_raise("marker")
-                except Exception:
-                    pass
                 return
 
             playing = runner.current_cue()
@@ -4963,27 +5678,18 @@ class App(tk.Tk):
             seg_end = float(playing.stop_at_sec) if playing.stop_at_sec is not None else float(duration)
             seg_end = max(seg_start, min(float(duration), seg_end))
 
-            width = max(1, int(canvas.winfo_width() or 1))
-            height = max(1, int(canvas.winfo_height() or 1))
+            width, height = self._canvas_size(f"wave_{deck}", canvas)
             if width < 10 or height < 10:
                 width, height = 600, 60
 
-            x0 = int((seg_start / float(duration)) * width)
-            x1 = int((seg_end / float(duration)) * width)
-            x0 = max(0, min(width, x0))
-            x1 = max(0, min(width, x1))
-            if x1 < x0:
-                x0, x1 = x1, x0
-
             p = max(seg_start, min(seg_end, float(pos)))
-            px = int((p / float(duration)) * width)
-            px = max(0, min(width, px))
+            x0, x1, px = _playback_geometry(seg_start, seg_end, p, duration, width)
 
             seg_len = max(0.001, seg_end - seg_start)
             seg_pos = max(0.0, min(seg_len, float(pos) - seg_start))
             frac = max(0.0, min(1.0, seg_pos / seg_len))
             blink = frac >= 0.80
-            blink_on = blink and (int(time.monotonic() * 4) % 2 == 0)
+            blink_on = blink and blink_fast
 
             items = self._ensure_playback_items(deck, canvas)
             self._set_playback_visibility(deck, canvas, visible=True)
@@ -5016,17 +5722,13 @@ class App(tk.Tk):
                 canvas.itemconfigure(items["out"], state="normal")
             else:
                 canvas.itemconfigure(items["out"], state="hidden")
-            try:
-                canvas.tag_raise("playback_bg")
-                canvas.tag_raise("playback_fg")
-                canvas.tag_raise("marker")
-            except Exception:
-                pass
         except Exception:
             return
 
-    def _update_deck_now_playing(self, deck: str, runner, var_time) -> None:
+    def _update_deck_now_playing(self, deck: str, runner, var_time, blink_fast: bool | None = None) -> None:
         """Update Now Playing display for a specific deck"""
+        if blink_fast is None:
+            blink_fast = _blink_phases()[1]
         label = getattr(self, "lbl_now_a_time", None) if deck == "A" else getattr(self, "lbl_now_b_time", None)
         default_fg = getattr(self, "_now_time_default_fg_a", None) if deck == "A" else getattr(self, "_now_time_default_fg_b", None)
 
@@ -5128,22 +5830,22 @@ class App(tk.Tk):
 
         # Blink in the last 20% of the marked segment (match waveform logic).
         blink = frac >= 0.80
-        blink_on = blink and (int(time.monotonic() * 4) % 2 == 0)
+        blink_on = blink and blink_fast
         _set_fg_cached("#ff1744" if blink_on else None)
 
     def _select_next_cue_for_deck(self, deck: str) -> None:
         if deck == "A":
             if self._selected_a >= 0 and self._selected_a + 1 < len(self._cues_a):
                 self._selected_a += 1
-                self.tree_a.selection_set(str(self._selected_a))
-                self.tree_a.see(str(self._selected_a))
+                self.tree_a.selection_set(self._cues_a[self._selected_a].id)
+                self.tree_a.see(self._cues_a[self._selected_a].id)
                 self._load_cue_into_editor(self._cues_a[self._selected_a])
                 self._log("Ready on next cue (Deck A).")
             return
         if self._selected_b >= 0 and self._selected_b + 1 < len(self._cues_b):
             self._selected_b += 1
-            self.tree_b.selection_set(str(self._selected_b))
-            self.tree_b.see(str(self._selected_b))
+            self.tree_b.selection_set(self._cues_b[self._selected_b].id)
+            self.tree_b.see(self._cues_b[self._selected_b].id)
             self._load_cue_into_editor(self._cues_b[self._selected_b])
             self._log("Ready on next cue (Deck B).")
 
@@ -5171,18 +5873,19 @@ class App(tk.Tk):
         self._update_showfile_label()
 
     def _load_show_from_path(self, path: Path, *, set_show_path: bool) -> None:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = _read_json_file(path)
         self.settings = Settings.from_dict(data.get("settings", {}))
         self.audio_runner.settings = self.settings
         self.video_runner.settings = self.settings
+        self._on_settings_changed()
 
         # Load dual deck cues
-        self._cues_a = [Cue.from_dict(x) for x in data.get("cues_a", [])]
-        self._cues_b = [Cue.from_dict(x) for x in data.get("cues_b", [])]
+        self._cues_a = _load_cue_list(data.get("cues_a", ()))
+        self._cues_b = _load_cue_list(data.get("cues_b", ()))
 
         # Legacy support - if old format, load to deck A
         if not self._cues_a and not self._cues_b and "cues" in data:
-            self._cues_a = [Cue.from_dict(x) for x in data.get("cues", [])]
+            self._cues_a = _load_cue_list(data.get("cues", ()))
 
         self._show_path = path if set_show_path else None
 
@@ -5192,6 +5895,8 @@ class App(tk.Tk):
 
         self._refresh_tree_a()
         self._refresh_tree_b()
+        self._prefetch_durations(self._cues_a + self._cues_b)
+        self._mark_dirty()
         self._load_selected_into_editor()
         self._update_showfile_label()
         try:
@@ -5247,13 +5952,7 @@ class App(tk.Tk):
     def _save_preset(self) -> None:
         path = self._preset_path()
         try:
-            payload = {
-                "version": 2,
-                "settings": self.settings.to_dict(),
-                "cues_a": [c.to_dict() for c in self._cues_a],
-                "cues_b": [c.to_dict() for c in self._cues_b],
-            }
-            path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+            _write_json_file(path, self._show_bytes())
             self._loaded_preset_path = path
             self._update_showfile_label()
             self._log(f"Preset saved: {path.name}")
@@ -5325,7 +6024,7 @@ class App(tk.Tk):
                 return
 
             # Calculate time from click position with millisecond precision
-            canvas_width = canvas.winfo_width()
+            canvas_width = self._canvas_size(f"wave_{deck}", canvas)[0]
             if canvas_width <= 0:
                 return
 
@@ -5349,7 +6048,7 @@ class App(tk.Tk):
                                 time_sec = max(float(cue.start_sec or 0.0), float(cue.stop_at_sec) - 0.001)
                             time_sec = max(0.0, min(float(duration), float(time_sec)))
                             self._suppress_finish[deck] = "seek"
-                            runner.play_at(cue, float(time_sec), volume_override=cue.volume_percent)
+                            runner.seek(float(time_sec))
                             self._active_runner = runner
                             self._log(f"Deck {deck}: Seek -> {_format_timecode(time_sec, with_ms=True)}")
                             return
@@ -5358,51 +6057,46 @@ class App(tk.Tk):
                 try:
                     # Store cue/playhead position for RESUME (shows on waveform when paused/stopped).
                     self._set_paused_state_for_deck(deck, (cue.id, float(time_sec)))
-                    self._update_waveform_playback_visuals()
+                    self._mark_dirty("waveform")
+                    self._schedule_ui_flush()
                 except Exception:
                     pass
                 return
 
             # Set the marker
+            ctx = self._deck_ctx[deck]
             if mark_type == "IN":
                 cue.start_sec = max(0.0, time_sec)
                 if cue.stop_at_sec is not None and cue.stop_at_sec < cue.start_sec:
                     cue.stop_at_sec = cue.start_sec
-                if deck == "A":
-                    self.var_in_a.set(_format_timecode(cue.start_sec, with_ms=True))
-                else:
-                    self.var_in_b.set(_format_timecode(cue.start_sec, with_ms=True))
-                self._log(f"Deck {deck}: Mark IN at {_format_timecode(cue.start_sec, with_ms=True)}")
+                tc = _format_timecode(cue.start_sec, with_ms=True)
+                ctx.var_in.set(tc)
             else:  # mark_type == "OUT"
                 cue.stop_at_sec = max(0.0, time_sec)
                 if cue.stop_at_sec < cue.start_sec:
                     cue.start_sec = cue.stop_at_sec
-                if deck == "A":
-                    self.var_out_a.set(_format_timecode(cue.stop_at_sec, with_ms=True) if cue.stop_at_sec else "—")
-                else:
-                    self.var_out_b.set(_format_timecode(cue.stop_at_sec, with_ms=True) if cue.stop_at_sec else "—")
-                self._log(f"Deck {deck}: Mark OUT at {_format_timecode(cue.stop_at_sec, with_ms=True)}")
+                tc = _format_timecode(cue.stop_at_sec, with_ms=True)
+                ctx.var_out.set(tc if cue.stop_at_sec else "—")
+            self._log(f"Deck {deck}: Mark {mark_type} at {tc}")
 
             # Update tree display
             self._update_tree_item(cue)
 
             # Refresh markers (fast path if waveform already exists)
-            self._refresh_waveform_markers(cue, canvas, deck)
+            self._schedule_wave_redraw(deck)
 
         except Exception as e:
             self._log(f"Waveform click error: {e}")
 
     # (waveform generation is handled by _request_waveform_generate + _apply_waveform_result)
 
+    def _show_bytes(self) -> bytes:
+        self._apply_pending_cue_volume()
+        return _encode_show_doc(self.settings.to_dict(), self._cues_a, self._cues_b)
+
     def _write_show(self, path: Path) -> None:
         try:
-            payload = {
-                "version": 2,
-                "settings": self.settings.to_dict(),
-                "cues_a": [c.to_dict() for c in self._cues_a],
-                "cues_b": [c.to_dict() for c in self._cues_b],
-            }
-            path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+            _write_json_file(path, self._show_bytes())
             self._log(f"Saved: {path.name}")
         except Exception as e:
             messagebox.showerror("Save failed", str(e))
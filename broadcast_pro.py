@@ -5,13 +5,16 @@ Inspired by RadioDJ, SAM Broadcaster, Mairlist
 """
 
 import atexit
+import functools
 import json
 import os
 import platform
+import shutil
 import subprocess
 import threading
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Literal
@@ -19,6 +22,11 @@ from typing import Optional, Literal
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # THEME - Professional Broadcast Dark UI
 # =============================================================================
@@ -58,12 +66,51 @@ class BroadcastTheme:
 
 T = BroadcastTheme
 
+CUE_ICONS = {"audio": "🎵", "video": "🎬", "ppt": "📊"}
+CUE_BGS = {"audio": T.CUE_AUDIO_BG, "video": T.CUE_VIDEO_BG, "ppt": T.CUE_PPT_BG}
+
 # =============================================================================
 # GLOBALS
 # =============================================================================
 
 _PROCESSES = []
 
+# Resolved once: launching by bare name repeats the $PATH search on every play/probe
+FFPLAY = shutil.which("ffplay") or "ffplay"
+FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Media duration cache: (path, mtime_ns, size) -> seconds, persisted between runs
+_PROBE_CACHE: dict[tuple[str, int, int], float] = {}
+_PROBE_CACHE_FILE = Path.home() / ".sp_show_ctrl" / "probe_cache.json"
+_PROBE_CACHE_DIRTY = False
+# ffprobe runs here, never on the Tk thread
+_PROBE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="probe")
+# Probe for the cue that is going live; never waits behind a prefetch batch
+_LIVE_PROBE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="probe-live")
+# Show/preset file reads and writes; separate so they never queue behind probes
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io")
+
+def _load_probe_cache():
+    try:
+        with open(_PROBE_CACHE_FILE) as f:
+            data = json.load(f)
+        for path, mtime_ns, size, dur in data:
+            _PROBE_CACHE[(path, int(mtime_ns), int(size))] = float(dur)
+    except:
+        pass
+
+def _save_probe_cache():
+    if not _PROBE_CACHE_DIRTY:
+        return
+    # Snapshot first: a probe worker that is still running may add entries meanwhile
+    cache = dict(_PROBE_CACHE)
+    try:
+        _PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        data = [[k[0], k[1], k[2], v] for k, v in cache.items() if os.path.exists(k[0])]
+        write_file_atomic(_PROBE_CACHE_FILE, json.dumps(data).encode("utf-8"))
+    except Exception as e:
+        print(f"Probe cache save error: {e}")
+
 def _cleanup():
     for p in _PROCESSES:
         try:
@@ -71,6 +118,12 @@ def _cleanup():
             p.wait(timeout=0.5)
         except:
             pass
+    # No new probes while the cache is written out
+    _PROBE_POOL.shutdown(wait=False, cancel_futures=True)
+    _LIVE_PROBE_POOL.shutdown(wait=False, cancel_futures=True)
+    _save_probe_cache()
+
+_load_probe_cache()
 
 atexit.register(_cleanup)
 
@@ -82,10 +135,8 @@ def fmt_time(sec: Optional[float]) -> str:
     """Format MM:SS.mmm"""
     if sec is None:
         return "00:00.000"
-    ms = max(0, int(sec * 1000))
-    m = ms // 60000
-    s = (ms // 1000) % 60
-    msec = ms % 1000
+    m, r = divmod(max(0, int(sec * 1000)), 60000)
+    s, msec = divmod(r, 1000)
     return f"{m:02d}:{s:02d}.{msec:03d}"
 
 def parse_time(s: str) -> Optional[float]:
@@ -101,15 +152,52 @@ def parse_time(s: str) -> Optional[float]:
     return None
 
 def get_duration(path: str) -> float:
-    """Get media duration with ffprobe"""
+    """Get media duration with ffprobe (cached per file version)"""
+    global _PROBE_CACHE_DIRTY
     try:
-        cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return 0.0
+    cached = _PROBE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    try:
+        cmd = [FFPROBE, "-v", "error", "-show_entries", "format=duration",
                "-of", "default=noprint_wrappers=1:nokey=1", path]
         res = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        return float(res.stdout.strip())
+        dur = float(res.stdout.strip())
     except:
         return 0.0
+    if dur > 0:
+        _PROBE_CACHE[key] = dur
+        _PROBE_CACHE_DIRTY = True
+    return dur
+
+def prefetch_durations(cues):
+    """Warm the duration cache for media cues in the background"""
+    for cue in cues:
+        if cue.type != "ppt":
+            _PROBE_POOL.submit(get_duration, cue.path)
+
+_OSA: Optional[subprocess.Popen] = None
+_OSA_LOCK = threading.Lock()
+
+def run_applescript(script: str):
+    """Run AppleScript lines through one long-lived `osascript -i` instead of a process per call"""
+    global _OSA
+    with _OSA_LOCK:
+        try:
+            if _OSA is None or _OSA.poll() is not None:
+                _OSA = subprocess.Popen(["osascript", "-i"], stdin=subprocess.PIPE,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True)
+                _PROCESSES.append(_OSA)
+            _OSA.stdin.write(script + "\n")
+            _OSA.stdin.flush()
+        except:
+            subprocess.Popen(["osascript", "-e", script])
 
+@functools.lru_cache(maxsize=512)
 def shorten(text: str, max_len: int = 30) -> str:
     """Shorten text with ellipsis"""
     if len(text) <= max_len:
@@ -154,6 +242,21 @@ class Cue:
     out_point: Optional[float] = None
     second_screen: bool = False
 
+    @functools.cached_property
+    def name(self) -> str:
+        """File name (a cue's path is fixed once created)"""
+        return Path(self.path).name
+
+    def row_text(self) -> str:
+        """Cue list row after the number column (rebuilt only when IN/OUT change)"""
+        key = (self.in_point, self.out_point)
+        cached = self.__dict__.get("_row")
+        if cached is None or cached[0] != key:
+            out_str = fmt_time(self.out_point) if self.out_point else "---"
+            text = f"{CUE_ICONS[self.type]}  {shorten(self.name, 28):30}  IN:{fmt_time(self.in_point)}  OUT:{out_str}"
+            cached = self.__dict__["_row"] = (key, text)
+        return cached[1]
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -177,6 +280,37 @@ class Cue:
             second_screen=d.get("second_screen", False),
         )
 
+def dumps_show(data) -> bytes:
+    """Indented show JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def write_file_atomic(path, data: bytes):
+    """Write via a synced temp file + os.replace, so a crash never leaves a truncated file"""
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except:
+        try:
+            os.remove(tmp)
+        except:
+            pass
+        raise
+
+def read_show_file(path) -> tuple[Settings, list[Cue]]:
+    """Read and decode a show/preset file (runs on _IO_POOL)"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    settings = Settings.from_dict(data.get("settings", {}))
+    cues = [Cue.from_dict(c) for c in data.get("cues", [])]
+    return settings, cues
+
 # =============================================================================
 # PLAYER ENGINE
 # =============================================================================
@@ -184,26 +318,39 @@ class Cue:
 class Player:
     """Single player deck"""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, when_done):
         self.settings = settings
+        self.when_done = when_done  # when_done(fut, callback) calls callback(fut) on the Tk thread
         self.cue: Optional[Cue] = None
         self.proc: Optional[subprocess.Popen] = None
         self.playing = False
         self.start_time = 0.0
+        self.offset = 0.0  # seconds past the IN point where the current ffplay started
+        self._clock: Optional[tuple] = None  # (proc, media position, monotonic time) from ffplay's status line
         self.volume = 100
         self.duration = 0.0
+        self._dur_future: Optional[Future] = None
 
-    def play(self, cue: Cue):
-        """Play a cue"""
+    def play(self, cue: Cue, offset: float = 0.0):
+        """Play a cue (optionally from offset seconds past its IN point)"""
+        restart = self.cue is cue and self.duration > 0
+        duration = self.duration
         self.stop()
         self.cue = cue
-        self.duration = get_duration(cue.path)
+        self.offset = max(0.0, offset)
+        self.duration = duration if restart else 0.0
 
         if cue.type == "ppt":
             self._open_ppt(cue.path)
             return
 
-        cmd = ["ffplay", "-nodisp", "-autoexit"]
+        if not restart:
+            # Start playback right away; the duration is filled in when the probe finishes
+            fut = _LIVE_PROBE_POOL.submit(get_duration, cue.path)
+            self._dur_future = fut
+            self.when_done(fut, lambda f, c=cue: self._on_duration(c, f))
+
+        cmd = [FFPLAY, "-nodisp", "-autoexit"]
 
         if cue.type == "video":
             if cue.second_screen:
@@ -214,23 +361,61 @@ class Player:
             else:
                 cmd.remove("-nodisp")
 
-        if cue.in_point > 0:
-            cmd.extend(["-ss", str(cue.in_point)])
+        start = cue.in_point + self.offset
+        if start > 0:
+            cmd.extend(["-ss", str(start)])
 
-        if cue.out_point and cue.out_point > cue.in_point:
-            cmd.extend(["-t", str(cue.out_point - cue.in_point)])
+        if cue.out_point and cue.out_point > start:
+            cmd.extend(["-t", str(cue.out_point - start)])
 
         cmd.extend(["-af", f"volume={self.volume/100.0}"])
         cmd.append(cue.path)
 
         try:
-            self.proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             _PROCESSES.append(self.proc)
             self.playing = True
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
+            threading.Thread(target=self._read_clock, args=(self.proc,), daemon=True).start()
         except Exception as e:
             print(f"Play error: {e}")
 
+    def _read_clock(self, proc: subprocess.Popen):
+        """Follow ffplay's status line ("  12.34 M-A: ...") for the real playback clock (reader thread)"""
+        buf = b""
+        try:
+            for chunk in iter(lambda: proc.stderr.read1(512), b""):
+                buf += chunk
+                parts = buf.replace(b"\r", b"\n").split(b"\n")
+                buf = parts.pop()
+                for line in reversed(parts):
+                    fields = line.split(None, 2)
+                    if len(fields) < 2 or fields[1] not in (b"A-V:", b"M-A:", b"M-V:"):
+                        continue
+                    try:
+                        pos = float(fields[0])
+                    except ValueError:
+                        continue
+                    if pos == pos:  # skip "nan" before the first frame
+                        self._clock = (proc, pos, time.monotonic())
+                    break
+        except:
+            pass
+
+    def _on_duration(self, cue: Cue, fut: Future):
+        """Probe finished (Tk thread)"""
+        if self.cue is cue and self._dur_future is fut:
+            try:
+                self.duration = float(fut.result())
+            except:
+                pass
+
+    def duration_known(self) -> bool:
+        """True once the total length is known (OUT point or probed duration)"""
+        if not self.cue:
+            return False
+        return bool(self.cue.out_point) or self.duration > 0
+
     def stop(self):
         """Stop playback"""
         if self.proc:
@@ -244,20 +429,28 @@ class Player:
             self.proc = None
         self.playing = False
         self.cue = None
+        self._dur_future = None
 
     def set_vol(self, vol: int):
-        """Change volume (requires restart)"""
-        self.volume = max(0, min(100, vol))
+        """Change volume (ffplay has no runtime control: restart at the current position)"""
+        vol = max(0, min(100, vol))
+        if vol == self.volume:
+            return
+        self.volume = vol
         if self.playing and self.cue:
-            elapsed = time.time() - self.start_time
-            self.cue.in_point += elapsed
-            self.play(self.cue)
+            # Resume via the player offset; the cue's saved IN point is left untouched
+            self.play(self.cue, offset=self.elapsed())
 
     def elapsed(self) -> float:
-        """Get elapsed time"""
+        """Get elapsed time since the IN point"""
         if not self.playing:
             return 0.0
-        return time.time() - self.start_time
+        now = time.monotonic()
+        clock = self._clock
+        if clock is not None and clock[0] is self.proc and self.cue and now - clock[2] < 1.0:
+            # ffplay's own clock (absolute media time), extrapolated since the last status line
+            return max(0.0, clock[1] + (now - clock[2]) - self.cue.in_point)
+        return self.offset + (now - self.start_time)
 
     def remaining(self) -> float:
         """Get remaining time"""
@@ -270,6 +463,19 @@ class Player:
             total = self.duration - self.cue.in_point
         return max(0, total - elapsed)
 
+    def status(self) -> tuple[float, Optional[float], float]:
+        """(elapsed, remaining or None while unprobed, progress) from a single clock read"""
+        if not self.playing or not self.cue:
+            return 0.0, 0.0, 0.0
+        elapsed = self.elapsed()
+        if self.cue.out_point:
+            total = self.cue.out_point - self.cue.in_point
+        elif self.duration > 0:
+            total = self.duration - self.cue.in_point
+        else:
+            return elapsed, None, 0.0
+        return elapsed, max(0, total - elapsed), min(1.0, elapsed / total) if total > 0 else 0.0
+
     def progress(self) -> float:
         """Get progress 0-1"""
         if not self.playing or not self.cue:
@@ -285,7 +491,7 @@ class Player:
         """Open PowerPoint"""
         if platform.system() == "Darwin":
             script = f'tell application "Microsoft PowerPoint" to activate\ntell application "Microsoft PowerPoint" to open POSIX file "{path}"'
-            subprocess.Popen(["osascript", "-e", script])
+            run_applescript(script)
         else:
             os.startfile(path)
 
@@ -334,11 +540,13 @@ class DeckWidget(tk.Frame):
 
         # Now playing
         self.lbl_now = tk.StringVar(value="—")
+        self._last_now = "—"
         tk.Label(body, textvariable=self.lbl_now, bg=T.PANEL_BG, fg=T.TEXT_PRIMARY,
                 font=("Arial", 11, "bold"), anchor="w").pack(fill="x")
 
         # Timecode
         self.lbl_tc = tk.StringVar(value="00:00.000 / 00:00.000")
+        self._last_tc = "00:00.000 / 00:00.000"
         tk.Label(body, textvariable=self.lbl_tc, bg=T.PANEL_BG, fg=T.BLUE,
                 font=("Courier New", 16, "bold"), anchor="w").pack(fill="x", pady=(3,0))
 
@@ -346,8 +554,13 @@ class DeckWidget(tk.Frame):
         prog_bg = tk.Frame(body, bg=T.HEADER_BG, height=6)
         prog_bg.pack(fill="x", pady=(8,0))
         prog_bg.pack_propagate(False)
-        self.prog_bar = tk.Frame(prog_bg, bg=T.BLUE, width=0)
-        self.prog_bar.pack(side="left", fill="y")
+        # Placed with a relative width: Tk scales it on resize, no sibling re-layout per tick
+        self.prog_bar = tk.Frame(prog_bg, bg=T.BLUE)
+        self.prog_bar.place(x=0, y=0, relheight=1, relwidth=0)
+        self._last_prog = 0.0
+        # Track width from resize events; no winfo_width() round-trip per tick
+        self._prog_w = 0
+        prog_bg.bind("<Configure>", lambda e: setattr(self, "_prog_w", e.width))
 
         # Transport
         trans = tk.Frame(body, bg=T.PANEL_BG)
@@ -380,12 +593,21 @@ class DeckWidget(tk.Frame):
         BroadcastButton(markers, "⏹ OUT", color=T.ORANGE,
                        cmd=app.mark_out, padx=16, pady=6).pack(side="left", padx=1)
 
-    def update(self, now: str, elapsed: float, remaining: float, progress: float):
-        """Update display"""
-        self.lbl_now.set(now)
-        self.lbl_tc.set(f"{fmt_time(elapsed)} / {fmt_time(remaining)}")
-        w = int(self.prog_bar.master.winfo_width() * progress)
-        self.prog_bar.config(width=max(0, w))
+    def update(self, now: str, elapsed: float, remaining: Optional[float], progress: float):
+        """Update display (remaining=None while the duration is still being probed)"""
+        if now != self._last_now:
+            self.lbl_now.set(now)
+            self._last_now = now
+        rem_str = fmt_time(remaining) if remaining is not None else "--:--.---"
+        tc = f"{fmt_time(elapsed)} / {rem_str}"
+        if tc != self._last_tc:
+            self.lbl_tc.set(tc)
+            self._last_tc = tc
+        progress = max(0.0, min(1.0, progress))
+        # Only move the bar once the change is worth at least a pixel
+        if progress != self._last_prog and (progress == 0.0 or abs(progress - self._last_prog) * self._prog_w >= 1):
+            self.prog_bar.place_configure(relwidth=progress)
+            self._last_prog = progress
 
 # =============================================================================
 # MAIN APPLICATION
@@ -403,10 +625,12 @@ class BroadcastApp(tk.Tk):
         self.cues: list[Cue] = []
         self.selected = -1
         self.preset_file = Path("show_preset.json")
+        self._advance_job = None  # pending auto-advance after() id
+        self._preset_bytes: Optional[bytes] = None  # what save_preset last wrote
 
         # Players
-        self.deck_a = Player(self.settings)
-        self.deck_b = Player(self.settings)
+        self.deck_a = Player(self.settings, self._when_done)
+        self.deck_b = Player(self.settings, self._when_done)
 
         # Build UI
         self._build_ui()
@@ -420,6 +644,7 @@ class BroadcastApp(tk.Tk):
         self.bind("<Right>", lambda e: self.go_live())
         self.bind("m", lambda e: self.mark_in())
         self.bind(".", lambda e: self.mark_out())
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Foreground
         self.lift()
@@ -550,20 +775,33 @@ class BroadcastApp(tk.Tk):
         tk.Label(live, text="Auto-advance playlist", bg=T.RED, fg=T.TEXT_PRIMARY,
                 font=("Arial", 9)).pack(pady=(0,8))
 
+    def _format_row(self, i: int, cue: Cue):
+        """Listbox text and background for one cue"""
+        return f"{i+1:3}  {cue.row_text()}", CUE_BGS[cue.type]
+
     def _refresh_list(self):
         """Refresh cue list"""
-        self.listbox.delete(0, tk.END)
-        for i, cue in enumerate(self.cues):
-            icon = {"audio": "🎵", "video": "🎬", "ppt": "📊"}[cue.type]
-            name = Path(cue.path).name
-            in_str = fmt_time(cue.in_point)
-            out_str = fmt_time(cue.out_point) if cue.out_point else "---"
-
-            line = f"{i+1:3}  {icon}  {shorten(name, 28):30}  IN:{in_str}  OUT:{out_str}"
-            self.listbox.insert(tk.END, line)
-
-            bg = {"audio": T.CUE_AUDIO_BG, "video": T.CUE_VIDEO_BG, "ppt": T.CUE_PPT_BG}[cue.type]
-            self.listbox.itemconfig(i, bg=bg, fg=T.TEXT_PRIMARY)
+        self._rebuild_from(0)
+
+    def _rebuild_from(self, start: int):
+        """Re-render rows start..end with one delete and one insert call"""
+        rows = [self._format_row(i, self.cues[i]) for i in range(start, len(self.cues))]
+        self.listbox.delete(start, tk.END)
+        # One insert call for all rows, then colours; no idle redraw runs in between
+        if rows:
+            self.listbox.insert(tk.END, *[line for line, _ in rows])
+        # Only bg is set per row; fg is inherited from the listbox itself
+        for i, (_, bg) in enumerate(rows, start):
+            self.listbox.itemconfig(i, bg=bg)
+
+    def _set_row(self, i: int):
+        """Rewrite one listbox row in place, keeping it selected if it was"""
+        line, bg = self._format_row(i, self.cues[i])
+        self.listbox.delete(i)
+        self.listbox.insert(i, line)
+        self.listbox.itemconfig(i, bg=bg)
+        if i == self.selected:
+            self.listbox.selection_set(i)
 
     def _on_select(self, event):
         """Handle selection"""
@@ -584,14 +822,19 @@ class BroadcastApp(tk.Tk):
 
         cue = Cue(id=str(uuid.uuid4()), type=typ, path=path)
         self.cues.append(cue)
-        self._refresh_list()
+        prefetch_durations([cue])
+        line, bg = self._format_row(len(self.cues) - 1, cue)
+        self.listbox.insert(tk.END, line)
+        self.listbox.itemconfig(tk.END, bg=bg)
 
     def remove_cue(self):
         """Remove selected cue"""
         if self.selected >= 0:
-            del self.cues[self.selected]
+            i = self.selected
+            del self.cues[i]
             self.selected = -1
-            self._refresh_list()
+            # Only the rows below shift, so only their numbers change
+            self._rebuild_from(i)
 
     def move_up(self):
         """Move cue up"""
@@ -599,8 +842,8 @@ class BroadcastApp(tk.Tk):
             i = self.selected
             self.cues[i], self.cues[i-1] = self.cues[i-1], self.cues[i]
             self.selected = i - 1
-            self._refresh_list()
-            self.listbox.selection_set(self.selected)
+            self._set_row(i)
+            self._set_row(i - 1)
 
     def move_down(self):
         """Move cue down"""
@@ -608,8 +851,8 @@ class BroadcastApp(tk.Tk):
             i = self.selected
             self.cues[i], self.cues[i+1] = self.cues[i+1], self.cues[i]
             self.selected = i + 1
-            self._refresh_list()
-            self.listbox.selection_set(self.selected)
+            self._set_row(i)
+            self._set_row(i + 1)
 
     def play_selected(self):
         """Play selected cue"""
@@ -623,6 +866,7 @@ class BroadcastApp(tk.Tk):
             self.deck_b.play(cue)
         else:
             self.deck_a.play(cue)
+        self._kick_updates()
 
     def play_deck(self, deck_id: str):
         """Play on specific deck"""
@@ -634,6 +878,7 @@ class BroadcastApp(tk.Tk):
             self.deck_a.play(cue)
         else:
             self.deck_b.play(cue)
+        self._kick_updates()
 
     def stop_deck(self, deck_id: str):
         """Stop deck"""
@@ -642,8 +887,18 @@ class BroadcastApp(tk.Tk):
         else:
             self.deck_b.stop()
 
+    def _on_close(self):
+        """Window closed: drop queued probes so quitting never waits on them"""
+        self._cancel_advance()
+        self.deck_a.stop()
+        self.deck_b.stop()
+        _PROBE_POOL.shutdown(wait=False, cancel_futures=True)
+        _LIVE_PROBE_POOL.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     def emergency_stop(self):
         """Stop all"""
+        self._cancel_advance()
         self.deck_a.stop()
         self.deck_b.stop()
 
@@ -665,7 +920,7 @@ class BroadcastApp(tk.Tk):
         elif self.deck_b.playing and self.deck_b.cue == cue:
             cue.in_point = cue.in_point + self.deck_b.elapsed()
 
-        self._refresh_list()
+        self._set_row(self.selected)
 
     def mark_out(self):
         """Mark OUT point"""
@@ -678,7 +933,7 @@ class BroadcastApp(tk.Tk):
         elif self.deck_b.playing and self.deck_b.cue == cue:
             cue.out_point = cue.in_point + self.deck_b.elapsed()
 
-        self._refresh_list()
+        self._set_row(self.selected)
 
     def go_live(self):
         """GO LIVE with auto-advance"""
@@ -688,113 +943,151 @@ class BroadcastApp(tk.Tk):
 
         if self.selected >= 0:
             self.play_selected()
-
-            def advance():
-                time.sleep(1)
-                cue = self.cues[self.selected]
-
-                if cue.type == "audio" and self.deck_a.playing:
-                    rem = self.deck_a.remaining()
-                    time.sleep(rem + 0.5)
-                    if self.selected < len(self.cues) - 1:
-                        self.selected += 1
-                        self.after(0, lambda: self.listbox.selection_set(self.selected))
-                        self.after(100, self.go_live)
-
-                elif cue.type == "video" and self.deck_b.playing:
-                    rem = self.deck_b.remaining()
-                    time.sleep(rem + 0.5)
-                    if self.selected < len(self.cues) - 1:
-                        self.selected += 1
-                        self.after(0, lambda: self.listbox.selection_set(self.selected))
-                        self.after(100, self.go_live)
-
-            threading.Thread(target=advance, daemon=True).start()
+            self._cancel_advance()
+            self._advance_job = self.after(1000, self._arm_advance, self.cues[self.selected])
+
+    def _cancel_advance(self):
+        """Drop a pending auto-advance"""
+        if self._advance_job is not None:
+            self.after_cancel(self._advance_job)
+            self._advance_job = None
+
+    def _arm_advance(self, cue: Cue):
+        """Schedule the next cue for when the live one ends (polls while its duration is unknown)"""
+        self._advance_job = None
+        deck = {"audio": self.deck_a, "video": self.deck_b}.get(cue.type)
+        if deck is None or not deck.playing or deck.cue is not cue:
+            return
+        if not deck.duration_known():
+            fut = deck._dur_future
+            if fut is not None and fut.done() and (fut.cancelled() or fut.exception() or not fut.result()):
+                return  # probe failed: length unknown, leave advancing to the operator
+            self._advance_job = self.after(100, self._arm_advance, cue)
+            return
+        remaining = deck.remaining()
+        if remaining <= 0:
+            return
+        self._advance_job = self.after(int((remaining + 0.5) * 1000), self._advance_next)
+
+    def _advance_next(self):
+        """Select the next cue and take it live"""
+        self._advance_job = None
+        if self.selected < len(self.cues) - 1:
+            self.selected += 1
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(self.selected)
+            self.go_live()
 
     def ppt_prev(self):
         """PPT previous"""
         if platform.system() == "Darwin":
             script = 'tell application "Microsoft PowerPoint" to go to previous slide active presentation'
-            subprocess.Popen(["osascript", "-e", script])
+            run_applescript(script)
 
     def ppt_start(self):
         """PPT start"""
         if platform.system() == "Darwin":
             script = 'tell application "Microsoft PowerPoint" to run slide show active presentation'
-            subprocess.Popen(["osascript", "-e", script])
+            run_applescript(script)
 
     def ppt_next(self):
         """PPT next"""
         if platform.system() == "Darwin":
             script = 'tell application "Microsoft PowerPoint" to go to next slide active presentation'
-            subprocess.Popen(["osascript", "-e", script])
+            run_applescript(script)
 
     def ppt_end(self):
         """PPT end"""
         if platform.system() == "Darwin":
             script = 'tell application "Microsoft PowerPoint" to exit slide show active presentation'
-            subprocess.Popen(["osascript", "-e", script])
+            run_applescript(script)
 
     def _start_updates(self):
         """Start update loop"""
-        def update():
-            # Deck A
-            if self.deck_a.playing and self.deck_a.cue:
-                name = Path(self.deck_a.cue.path).name
-                self.widget_a.update(
-                    f"▶ {shorten(name, 28)}",
-                    self.deck_a.elapsed(),
-                    self.deck_a.remaining(),
-                    self.deck_a.progress()
-                )
-            else:
-                self.widget_a.update("—", 0, 0, 0)
-
-            # Deck B
-            if self.deck_b.playing and self.deck_b.cue:
-                name = Path(self.deck_b.cue.path).name
-                self.widget_b.update(
-                    f"▶ {shorten(name, 28)}",
-                    self.deck_b.elapsed(),
-                    self.deck_b.remaining(),
-                    self.deck_b.progress()
-                )
-            else:
-                self.widget_b.update("—", 0, 0, 0)
-
-            self.after(100, update)
-
-        update()
+        self._update_job = None
+        self._idle_shown = {"a": False, "b": False}  # deck already shows its stopped state
+        self._now_label = {}  # deck -> (cue, "▶ name") for the cue on air
+        self._update_decks()
+
+    def _kick_updates(self):
+        """Refresh the decks now instead of waiting out the idle tick"""
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+        self._update_decks()
+
+    def _update_deck(self, key: str, deck: Player, widget: DeckWidget):
+        """Push one deck's state to its widget"""
+        if deck.playing and deck.cue:
+            self._idle_shown[key] = False
+            # The label only changes with the cue; the clock is read once per tick
+            cue = deck.cue
+            if self._now_label.get(key, (None,))[0] is not cue:
+                self._now_label[key] = (cue, f"▶ {shorten(cue.name, 28)}")
+            widget.update(self._now_label[key][1], *deck.status())
+        elif not self._idle_shown[key]:
+            self._idle_shown[key] = True
+            widget.update("—", 0, 0, 0)
+
+    def _update_decks(self):
+        """Update loop tick"""
+        self._update_deck("a", self.deck_a, self.widget_a)
+        self._update_deck("b", self.deck_b, self.widget_b)
+
+        # Nothing moves while both decks are stopped: tick slower (play actions kick the loop)
+        delay = 100 if (self.deck_a.playing or self.deck_b.playing) else 500
+        self._update_job = self.after(delay, self._update_decks)
 
     def _load_preset(self):
         """Load preset"""
         if not self.preset_file.exists():
             return
 
-        try:
-            with open(self.preset_file) as f:
-                data = json.load(f)
+        def done(fut):
+            try:
+                self._apply_show(*fut.result())
+            except Exception as e:
+                print(f"Load error: {e}")
 
-            self.settings = Settings.from_dict(data.get("settings", {}))
-            self.cues = [Cue.from_dict(c) for c in data.get("cues", [])]
-            self._refresh_list()
-        except Exception as e:
-            print(f"Load error: {e}")
+        self._when_done(_IO_POOL.submit(read_show_file, self.preset_file), done)
+
+    def _when_done(self, fut: Future, callback):
+        """Call callback(fut) on the Tk thread once fut has finished"""
+        if fut.done():
+            callback(fut)
+        else:
+            self.after(20, self._when_done, fut, callback)
+
+    def _apply_show(self, settings: Settings, cues: list[Cue]):
+        """Swap in a loaded show"""
+        self.settings = settings
+        self.cues = cues
+        self._refresh_list()
+        prefetch_durations(self.cues)
 
     def save_preset(self):
-        """Save preset"""
+        """Save preset (encoded and written on _IO_POOL; data is a snapshot of plain dicts)"""
         data = {
             "version": 2,
             "settings": self.settings.to_dict(),
             "cues": [c.to_dict() for c in self.cues],
         }
 
-        try:
-            with open(self.preset_file, "w") as f:
-                json.dump(data, f, indent=2)
-            messagebox.showinfo("Saved", "Preset saved")
-        except Exception as e:
-            messagebox.showerror("Error", f"Save failed: {e}")
+        def write():
+            raw = dumps_show(data)
+            # Unchanged since the last save and still on disk: nothing to write
+            if raw != self._preset_bytes or not self.preset_file.exists():
+                write_file_atomic(self.preset_file, raw)
+                self._preset_bytes = raw
+
+        self._when_done(_IO_POOL.submit(write), lambda fut: self._report_save(fut, "Preset saved"))
+
+    def _report_save(self, fut: Future, message: str):
+        """Show the outcome of a background save"""
+        err = fut.exception()
+        if err is None:
+            messagebox.showinfo("Saved", message)
+        else:
+            messagebox.showerror("Error", f"Save failed: {err}")
 
     def save_show(self):
         """Save show"""
@@ -808,12 +1101,8 @@ class BroadcastApp(tk.Tk):
             "cues": [c.to_dict() for c in self.cues],
         }
 
-        try:
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
-            messagebox.showinfo("Saved", "Show saved")
-        except Exception as e:
-            messagebox.showerror("Error", f"Save failed: {e}")
+        fut = _IO_POOL.submit(lambda: write_file_atomic(path, dumps_show(data)))
+        self._when_done(fut, lambda fut: self._report_save(fut, "Show saved"))
 
     def open_show(self):
         """Open show"""
@@ -821,16 +1110,14 @@ class BroadcastApp(tk.Tk):
         if not path:
             return
 
-        try:
-            with open(path) as f:
-                data = json.load(f)
+        def done(fut):
+            try:
+                self._apply_show(*fut.result())
+                messagebox.showinfo("Loaded", "Show loaded")
+            except Exception as e:
+                messagebox.showerror("Error", f"Load failed: {e}")
 
-            self.settings = Settings.from_dict(data.get("settings", {}))
-            self.cues = [Cue.from_dict(c) for c in data.get("cues", [])]
-            self._refresh_list()
-            messagebox.showinfo("Loaded", "Show loaded")
-        except Exception as e:
-            messagebox.showerror("Error", f"Load failed: {e}")
+        self._when_done(_IO_POOL.submit(read_show_file, path), done)
 
     def open_settings(self):
         """Open settings"""
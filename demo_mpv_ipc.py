@@ -10,6 +10,9 @@ import subprocess
 import time
 import json
 import socket
+import itertools
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from screeninfo import get_monitors
 
@@ -22,26 +25,99 @@ TEST_PLAYLIST = [
 
 SOCKET_PATH = "/tmp/mpv_demo_socket"
 
+# One persistent IPC connection; replies are matched to requests by request_id
+_ipc_sock = None
+_ipc_lock = threading.Lock()
+_ipc_pending = {}  # request_id -> Future
+_ipc_ids = itertools.count(1)
+
+_MONITORS_CACHE = None  # monitor layout, enumerated once for the life of the demo
+
 def get_second_monitor():
-    """Get second monitor info"""
-    monitors = get_monitors()
-    if len(monitors) >= 2:
-        return monitors[1]
+    """Get second monitor info (monitors are enumerated once per process)"""
+    global _MONITORS_CACHE
+    if _MONITORS_CACHE is None:
+        _MONITORS_CACHE = get_monitors()
+    if len(_MONITORS_CACHE) >= 2:
+        return _MONITORS_CACHE[1]
     return None
 
-def send_mpv_command(command_dict):
-    """Send JSON command to MPV via IPC socket"""
+def _ipc_connect():
+    """Open the persistent IPC connection and start its reader thread"""
+    global _ipc_sock
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.connect(SOCKET_PATH)
-        command = json.dumps(command_dict) + '\n'
-        sock.send(command.encode('utf-8'))
-        response = sock.recv(4096).decode('utf-8')
+    except OSError:
         sock.close()
-        return json.loads(response) if response else None
+        raise
+    _ipc_sock = sock
+    threading.Thread(target=_ipc_reader, args=(sock,), daemon=True).start()
+    return sock
+
+def _ipc_reader(sock):
+    """Hand each reply to the request waiting for it (MPV events have no request_id and are skipped)"""
+    global _ipc_sock
+    buf = b""
+    try:
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            buf += chunk
+            *lines, buf = buf.split(b"\n")
+            for line in lines:
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                fut = _ipc_pending.pop(msg.get("request_id"), None)
+                if fut is not None:
+                    fut.set_result(msg)
+    except OSError:
+        pass
+    # Connection gone: release anyone still waiting, reconnect on the next command
+    with _ipc_lock:
+        if _ipc_sock is sock:
+            _ipc_sock = None
+        for rid in list(_ipc_pending):
+            _ipc_pending.pop(rid).set_result(None)
+
+def close_mpv_ipc():
+    """Close the persistent IPC connection"""
+    global _ipc_sock
+    with _ipc_lock:
+        sock, _ipc_sock = _ipc_sock, None
+    if sock is not None:
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+def send_mpv_command(command_dict, timeout=2.0):
+    """Send JSON command to MPV via IPC socket
+
+    A list of commands is pipelined: all are written in one send and the
+    replies (in the same order) are returned as a list.
+    """
+    batch = isinstance(command_dict, list)
+    commands = command_dict if batch else [command_dict]
+    rids = [next(_ipc_ids) for _ in commands]
+    futs = [Future() for _ in commands]
+    try:
+        with _ipc_lock:
+            sock = _ipc_sock or _ipc_connect()
+            _ipc_pending.update(zip(rids, futs))
+            payload = "".join(json.dumps({**c, "request_id": rid}) + '\n' for c, rid in zip(commands, rids))
+            sock.sendall(payload.encode('utf-8'))
+        deadline = time.monotonic() + timeout
+        results = [f.result(timeout=max(0.0, deadline - time.monotonic())) for f in futs]
+        return results if batch else results[0]
     except Exception as e:
+        for rid in rids:
+            _ipc_pending.pop(rid, None)
         print(f"IPC Error: {e}")
-        return None
+        return [None] * len(commands) if batch else None
 
 def start_mpv_with_ipc():
     """Start MPV with IPC enabled"""
@@ -80,14 +156,19 @@ def start_mpv_with_ipc():
         stderr=subprocess.DEVNULL
     )
 
-    # Wait for socket to be ready
+    # Wait for socket to be ready: retry connect() with backoff instead of a fixed sleep
     print("⏳ Waiting for MPV to initialize...")
-    for i in range(30):
-        if Path(SOCKET_PATH).exists():
-            time.sleep(0.5)  # Extra time for socket to be ready
+    deadline = time.monotonic() + 5.0
+    delay = 0.01
+    while time.monotonic() < deadline and proc.poll() is None:
+        try:
+            with _ipc_lock:
+                _ipc_connect()
             print("✓ MPV ready!\n")
             return proc
-        time.sleep(0.1)
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
 
     print("❌ MPV socket not ready!")
     proc.kill()
@@ -201,6 +282,7 @@ def main():
         print("\n\n⚠ Demo interrupted by user")
     finally:
         # Cleanup
+        close_mpv_ipc()
         try:
             proc.kill()
         except:
@@ -1,28 +1,58 @@
 #!/usr/bin/env python3
 """Screen detection using Quartz (macOS only)"""
+import functools
+
 try:
-    from Quartz import CGDisplayBounds, CGMainDisplayID, CGGetActiveDisplayList
+    from Quartz import (
+        CGDisplayBounds,
+        CGGetActiveDisplayList,
+        CGMainDisplayID,
+    )
+except ImportError:
+    CGGetActiveDisplayList = None
+
+
+@functools.lru_cache(maxsize=1)
+def get_displays():
+    """Active displays as (x, y, width, height, is_main) rows, cached for the life of the process"""
+    # No CFRunLoop runs here, so reconfiguration callbacks never fire; a long-running
+    # caller must call get_displays.cache_clear() to see a hot-plugged screen.
+    if CGGetActiveDisplayList is None:
+        raise ImportError("Quartz module not available - install pyobjc-framework-Quartz")
 
-    # Get all active displays
     max_displays = 16
     (error, active_displays, display_count) = CGGetActiveDisplayList(max_displays, None, None)
+    if error != 0:
+        raise OSError(f"Error getting display list: {error}")
 
-    if error == 0:
-        print(f"Found {display_count} display(s)")
+    main_display = CGMainDisplayID()
+    rows = []
+    for display_id in active_displays[:display_count]:
+        bounds = CGDisplayBounds(display_id)
+        rows.append((
+            int(round(bounds.origin.x)),
+            int(round(bounds.origin.y)),
+            int(round(bounds.size.width)),
+            int(round(bounds.size.height)),
+            display_id == main_display,
+        ))
+    return tuple(rows)
 
-        main_display = CGMainDisplayID()
 
-        for i, display_id in enumerate(active_displays[:display_count]):
-            bounds = CGDisplayBounds(display_id)
-            is_main = " (main)" if display_id == main_display else ""
-            print(f"Display {i}{is_main}: origin=({bounds.origin.x:.0f}, {bounds.origin.y:.0f}), size=({bounds.size.width:.0f}x{bounds.size.height:.0f})")
-
-            # If this is not the main display, print its coordinates
-            if display_id != main_display:
-                print(f"COORDS:{bounds.origin.x:.0f},{bounds.origin.y:.0f}")
+if __name__ == "__main__":
+    try:
+        displays = get_displays()
+    except ImportError:
+        print("Quartz module not available - install pyobjc-framework-Quartz")
+        print("Run: pip3 install pyobjc-framework-Quartz")
+    except OSError as e:
+        print(e)
     else:
-        print(f"Error getting display list: {error}")
+        print(f"Found {len(displays)} display(s)")
+        for i, (x, y, w, h, is_main) in enumerate(displays):
+            main_tag = " (main)" if is_main else ""
+            print(f"Display {i}{main_tag}: origin=({x}, {y}), size=({w}x{h})")
 
-except ImportError:
-    print("Quartz module not available - install pyobjc-framework-Quartz")
-    print("Run: pip3 install pyobjc-framework-Quartz")
+            # If this is not the main display, print its coordinates
+            if not is_main:
+                print(f"COORDS:{x},{y}")
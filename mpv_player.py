@@ -10,7 +10,11 @@ the player window.
 import subprocess
 import json
 import socket
+import threading
+import itertools
+import re
 import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Optional
 from screeninfo import get_monitors
@@ -27,10 +31,22 @@ class MPVPlayer:
     - Hardware decoding for 4K videos
     """
 
+    # Pushed by MPV via observe_property and served from cache by the getters
+    OBSERVED_PROPERTIES = ("duration", "pause", "time-pos")
+
     def __init__(self, socket_path: str = "/tmp/sp_show_mpv_socket"):
         self.socket_path = socket_path
         self.process: Optional[subprocess.Popen] = None
         self._current_media: Optional[str] = None
+        # One IPC connection for the player's lifetime, shared by all commands
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._pending: dict = {}  # request_id -> Future, for the current connection
+        self._props: dict = {}  # latest values of OBSERVED_PROPERTIES
+        # loadfile per-file options: None = unknown MPV version, else whether the
+        # 0.38+ signature (with a playlist index before the options) applies
+        self._loadfile_has_index: Optional[bool] = None
 
     def is_running(self) -> bool:
         """Check if MPV process is running"""
@@ -83,45 +99,211 @@ class MPVPlayer:
             stdin=subprocess.DEVNULL
         )
 
-        # Wait for IPC socket to be ready
-        for _ in range(50):  # 5 seconds max
-            if Path(self.socket_path).exists():
-                time.sleep(0.1)  # Extra time for socket
+        # Wait for IPC socket to be ready (5 seconds max): connect as soon as MPV listens
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline and self.is_running():
+            try:
+                with self._lock:
+                    self._connect()
                 break
-            time.sleep(0.1)
+            except OSError:
+                time.sleep(0.05)
+
+        self._detect_loadfile_signature()
+
+    def _detect_loadfile_signature(self):
+        """Ask MPV for its version once; decides how per-file options are passed to loadfile"""
+        response = self._send_command({"command": ["get_property", "mpv-version"]})
+        match = re.search(r"(\d+)\.(\d+)", str((response or {}).get("data") or ""))
+        if match:
+            self._loadfile_has_index = (int(match.group(1)), int(match.group(2))) >= (0, 38)
+
+    def _connect(self) -> socket.socket:
+        """
+        Open (or reopen) the persistent IPC connection. Caller holds self._lock.
+
+        Starts the reader thread for the connection and subscribes to the
+        properties kept in self._props.
+
+        Returns:
+            The connected socket
+        """
+        self._close_socket()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._pending = {}
+        self._props = {}
+        threading.Thread(target=self._reader, args=(sock, self._pending), daemon=True).start()
+
+        # MPV pushes these on every change, so the getters need no round-trip
+        payload = "".join(
+            json.dumps({"command": ["observe_property", observer_id, name]}) + '\n'
+            for observer_id, name in enumerate(self.OBSERVED_PROPERTIES, 1)
+        )
+        sock.sendall(payload.encode('utf-8'))
+        return sock
+
+    def _close_socket(self):
+        """Drop the IPC connection (its reader thread exits and releases waiters)"""
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)  # wakes the reader blocked in recv()
+            except OSError:
+                pass
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def _reader(self, sock: socket.socket, pending: dict):
+        """
+        Read MPV's messages for one connection (runs on its own thread).
+
+        Property changes update self._props; replies complete the Future
+        registered under their request_id; other events are ignored.
 
-    def _send_command(self, command: dict) -> Optional[dict]:
+        Args:
+            sock: The IPC socket
+            pending: request_id -> Future for this connection
+        """
+        buf = b""
+        try:
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                buf += chunk
+                *lines, buf = buf.split(b'\n')
+                for line in lines:
+                    try:
+                        message = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if message.get("event") == "property-change":
+                        self._props[message.get("name")] = message.get("data")
+                        continue
+                    future = pending.pop(message.get("request_id"), None)
+                    if future is not None:
+                        future.set_result(message)
+        except OSError:
+            pass
+
+        # Connection gone: release anyone still waiting; the next command reconnects
+        with self._lock:
+            if self._sock is sock:
+                self._close_socket()
+            for request_id in list(pending):
+                pending.pop(request_id).set_result(None)
+
+    def _send_command(self, command: dict, wait_reply: bool = True) -> Optional[dict]:
         """
         Send JSON command to MPV via IPC socket.
 
         Args:
             command: JSON-RPC command dict
+            wait_reply: False to return right after sending (setters whose reply is unused)
 
         Returns:
-            Response dict or None on error
+            Response dict or None on error (always None when not waiting)
         """
-        if not self.is_running():
-            return None
+        return self._send_batch([command], wait_reply)[0]
 
-        try:
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(2.0)
-            sock.connect(self.socket_path)
+    def _send_batch(self, commands: list, wait_reply: bool = True) -> list:
+        """
+        Send several JSON commands in one write and collect their replies.
 
-            # Send command
-            cmd_str = json.dumps(command) + '\n'
-            sock.send(cmd_str.encode('utf-8'))
+        MPV handles the commands in order and answers each one, so N commands
+        cost one round-trip instead of N.
 
-            # Read response
-            response = sock.recv(4096).decode('utf-8')
-            sock.close()
+        Args:
+            commands: JSON-RPC command dicts
+            wait_reply: False to return right after sending; the reader thread
+                drops the unclaimed replies
 
-            if response:
-                return json.loads(response.strip())
-            return None
+        Returns:
+            Response dicts (None where a command failed), in command order
+        """
+        if not self.is_running():
+            return [None] * len(commands)
 
-        except (socket.error, json.JSONDecodeError, Exception):
-            return None
+        futures = []
+        request_ids = []
+        pending = self._pending
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    sock = self._sock or self._connect()
+                    if wait_reply:
+                        pending = self._pending
+                        request_ids = [next(self._request_ids) for _ in commands]
+                        futures = [Future() for _ in commands]
+                        pending.update(zip(request_ids, futures))
+                        commands = [
+                            {**command, "request_id": request_id}
+                            for command, request_id in zip(commands, request_ids)
+                        ]
+                    payload = "".join(json.dumps(command) + '\n' for command in commands)
+                    sock.sendall(payload.encode('utf-8'))
+                    break
+
+                except (BrokenPipeError, ConnectionResetError):
+                    # MPV dropped the connection: reconnect once and retry
+                    self._close_socket()
+                    self._forget(pending, request_ids)
+                    futures = []
+                    if attempt:
+                        return [None] * len(commands)
+                except OSError:
+                    self._close_socket()
+                    self._forget(pending, request_ids)
+                    return [None] * len(commands)
+                except Exception:
+                    self._forget(pending, request_ids)
+                    raise
+
+        if not wait_reply:
+            return [None] * len(commands)
+
+        # The reader thread completes these; wait outside the lock so commands can overlap
+        deadline = time.monotonic() + 2.0
+        responses = []
+        for request_id, future in zip(request_ids, futures):
+            try:
+                responses.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                # Unregister so a late reply is dropped instead of completing a dead Future
+                pending.pop(request_id, None)
+                responses.append(None)
+        return responses
+
+    def _forget(self, pending: dict, request_ids: list):
+        """Unregister request ids whose replies will never be waited for"""
+        for request_id in request_ids:
+            pending.pop(request_id, None)
+
+    def _get_property(self, name: str):
+        """
+        Read a property, from the observed cache when MPV has pushed it.
+
+        Args:
+            name: MPV property name
+
+        Returns:
+            The property value, or None if unavailable
+        """
+        props = self._props
+        if name in props:
+            return props[name]
+        response = self._send_command({"command": ["get_property", name]})
+        if response and "data" in response:
+            return response["data"]
+        return None
 
     def load_media(self, media_path: str, start_time: float = 0.0, replace: bool = True):
         """
@@ -137,14 +319,26 @@ class MPVPlayer:
 
         mode = "replace" if replace else "append-play"
 
-        # Load file
-        cmd = {
-            "command": ["loadfile", str(media_path), mode]
-        }
-        self._send_command(cmd)
-
-        # Seek to start time if specified
-        if start_time > 0:
+        # Start time goes in as a per-file option, so MPV opens the file already
+        # positioned instead of loading, waiting and seeking
+        load = ["loadfile", str(media_path), mode]
+        seek_after = start_time > 0 and self._loadfile_has_index is None
+        if start_time > 0 and not seek_after:
+            if self._loadfile_has_index:
+                load.append(-1)
+            load.append(f"start={start_time:.3f}")
+
+        # The new file's duration arrives as a fresh property-change
+        self._props.pop("duration", None)
+
+        # Load file and make sure it plays even if the previous cue was left paused
+        self._send_batch([
+            {"command": load},
+            {"command": ["set_property", "pause", False]},
+        ], wait_reply=False)
+
+        # Unknown MPV version: fall back to seeking once the file has loaded
+        if seek_after:
             time.sleep(0.2)  # Wait for file to load
             self.seek(start_time, absolute=True)
 
@@ -153,17 +347,17 @@ class MPVPlayer:
     def play(self):
         """Resume playback"""
         cmd = {"command": ["set_property", "pause", False]}
-        self._send_command(cmd)
+        self._send_command(cmd, wait_reply=False)
 
     def pause(self):
         """Pause playback"""
         cmd = {"command": ["set_property", "pause", True]}
-        self._send_command(cmd)
+        self._send_command(cmd, wait_reply=False)
 
     def stop(self):
         """Stop playback (keep window open)"""
         cmd = {"command": ["stop"]}
-        self._send_command(cmd)
+        self._send_command(cmd, wait_reply=False)
 
     def seek(self, seconds: float, absolute: bool = False):
         """
@@ -177,7 +371,7 @@ class MPVPlayer:
             cmd = {"command": ["seek", str(seconds), "absolute"]}
         else:
             cmd = {"command": ["seek", str(seconds), "relative"]}
-        self._send_command(cmd)
+        self._send_command(cmd, wait_reply=False)
 
     def set_volume(self, volume: int):
         """
@@ -188,7 +382,7 @@ class MPVPlayer:
         """
         volume = max(0, min(100, volume))
         cmd = {"command": ["set_property", "volume", volume]}
-        self._send_command(cmd)
+        self._send_command(cmd, wait_reply=False)
 
     def get_position(self) -> Optional[float]:
         """
@@ -197,15 +391,10 @@ class MPVPlayer:
         Returns:
             Position in seconds or None
         """
-        cmd = {"command": ["get_property", "time-pos"]}
-        response = self._send_command(cmd)
-
-        if response and "data" in response:
-            try:
-                return float(response["data"])
-            except (ValueError, TypeError):
-                pass
-        return None
+        try:
+            return float(self._get_property("time-pos"))
+        except (ValueError, TypeError):
+            return None
 
     def get_duration(self) -> Optional[float]:
         """
@@ -214,15 +403,10 @@ class MPVPlayer:
         Returns:
             Duration in seconds or None
         """
-        cmd = {"command": ["get_property", "duration"]}
-        response = self._send_command(cmd)
-
-        if response and "data" in response:
-            try:
-                return float(response["data"])
-            except (ValueError, TypeError):
-                pass
-        return None
+        try:
+            return float(self._get_property("duration"))
+        except (ValueError, TypeError):
+            return None
 
     def is_playing(self) -> bool:
         """
@@ -231,13 +415,11 @@ class MPVPlayer:
         Returns:
             True if playing, False if paused/stopped
         """
-        cmd = {"command": ["get_property", "pause"]}
-        response = self._send_command(cmd)
-
-        if response and "data" in response:
-            # "pause" property: False means playing
-            return not response["data"]
-        return False
+        paused = self._get_property("pause")
+        if paused is None:
+            return False
+        # "pause" property: False means playing
+        return not paused
 
     def quit(self):
         """Quit MPV player and close window"""
@@ -262,6 +444,9 @@ class MPVPlayer:
 
             self.process = None
 
+        with self._lock:
+            self._close_socket()
+
         # Clean up socket
         if Path(self.socket_path).exists():
             try: